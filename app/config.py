@@ -1,5 +1,6 @@
+from collections.abc import Callable
 from enum import StrEnum
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -90,25 +91,20 @@ class AppSettings(BaseSettings):
             return ["*"]
         return [item.strip() for item in raw.split(",") if item.strip()]
 
-    @property
+    # Parsed once per settings instance; these are read on every app build and runtime-config request.
+    @cached_property
     def cors_allowed_origins(self) -> list[str]:
         return self.csv(self.CORS_ALLOWED_ORIGINS)
 
-    @property
+    @cached_property
     def cors_allow_methods(self) -> list[str]:
-        methods = self.CORS_ALLOW_METHODS.strip()
-        if methods == "*":
-            return ["*"]
-        return [m.strip() for m in methods.split(",") if m.strip()]
+        return self.csv(self.CORS_ALLOW_METHODS)
 
-    @property
+    @cached_property
     def cors_allow_headers(self) -> list[str]:
-        headers = self.CORS_ALLOW_HEADERS.strip()
-        if headers == "*":
-            return ["*"]
-        return [h.strip() for h in headers.split(",") if h.strip()]
+        return self.csv(self.CORS_ALLOW_HEADERS)
 
-    @property
+    @cached_property
     def auth_algorithms(self) -> list[str]:
         return self.csv(self.AUTH_ALGORITHMS)
 
@@ -186,3 +182,28 @@ def get_api_roles() -> dict[str, str]:
         "delete": settings.ROLES_DELETE,
         "admin": settings.ROLES_ADMIN,
     }
+
+
+_SETTINGS_CACHES: dict[str, tuple[Callable[[], None], ...]] = {
+    "app": (get_app_settings.cache_clear, get_api_roles.cache_clear),
+    "db": (get_db_settings.cache_clear,),
+    "roles": (get_api_roles.cache_clear,),
+}
+
+
+def reset_settings_cache(name: str | None = None) -> None:
+    """
+    Clear cached settings singletons (handy for tests).
+    Clears every cache when *name* is omitted; clearing "app" also drops the derived role mapping.
+    """
+    if name is None:
+        for clears in _SETTINGS_CACHES.values():
+            for clear in clears:
+                clear()
+        return
+    try:
+        clears = _SETTINGS_CACHES[name]
+    except KeyError as exc:
+        raise ValueError(f"Unknown settings cache: {name!r}") from exc
+    for clear in clears:
+        clear()
@@ -0,0 +1,54 @@
+"""Tests for the cached settings factories in app.config."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from app.config import AppSettings, get_api_roles, get_app_settings, get_db_settings, reset_settings_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_settings_cache() -> Iterator[None]:
+    # Settings built from a test's patched environment must not leak into later tests.
+    yield
+    reset_settings_cache()
+
+
+def test_settings_getters_return_cached_singletons() -> None:
+    assert get_app_settings() is get_app_settings()
+    assert get_db_settings() is get_db_settings()
+
+
+def test_reset_settings_cache_clears_single_entry() -> None:
+    app_settings = get_app_settings()
+    db_settings = get_db_settings()
+
+    reset_settings_cache("db")
+
+    assert get_app_settings() is app_settings
+    assert get_db_settings() is not db_settings
+
+
+def test_reset_settings_cache_app_also_clears_roles(monkeypatch: pytest.MonkeyPatch) -> None:
+    get_api_roles()
+    monkeypatch.setenv("ROLES_READ", "viewer")
+
+    reset_settings_cache("app")
+
+    assert get_api_roles()["read"] == "viewer"
+
+
+def test_reset_settings_cache_rejects_unknown_name() -> None:
+    with pytest.raises(ValueError, match="Unknown settings cache"):
+        reset_settings_cache("nope")
+
+
+def test_csv_properties_are_parsed_once() -> None:
+    settings = AppSettings(CORS_ALLOWED_ORIGINS=" http://a , ,http://b", CORS_ALLOW_METHODS="*")
+
+    origins = settings.cors_allowed_origins
+
+    assert origins == ["http://a", "http://b"]
+    assert settings.cors_allowed_origins is origins
+    assert settings.cors_allow_methods == ["*"]
+    assert "cors_allowed_origins" not in settings.model_dump()
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import TypeGuard, cast
 
 from app.config import AppSettings, DbSettings, get_app_settings, get_db_settings
@@ -184,15 +185,27 @@ def _service_startup_states(runtime_service: RuntimeService | None) -> tuple[lis
     return states, ok
 
 
+@lru_cache(maxsize=8)
+def _health_config(log_level: str, test_mode: bool, port: int, database: str) -> HealthConfig:
+    # Values come from already validated settings (get_db_settings enforces
+    # port/database when the DB is enabled), so skip re-validating per request.
+    return HealthConfig.model_construct(
+        app=HealthSettingsApp.model_construct(log_level=log_level, test_mode=test_mode),
+        db=HealthSettingsDB.model_construct(port=port, database=database),
+    )
+
+
 def _serialize_health_config() -> HealthConfig | None:
     db_settings = get_db_settings()
     if not db_settings.DB_ENABLED:
         return None
 
     app_settings = get_app_settings()
-    return HealthConfig(
-        app=HealthSettingsApp(log_level=app_settings.LOG_LEVEL.value, test_mode=app_settings.TEST_MODE),
-        db=HealthSettingsDB(port=cast(int, db_settings.DB_PORT), database=cast(str, db_settings.DB_DATABASE)),
+    return _health_config(
+        app_settings.LOG_LEVEL.value,
+        app_settings.TEST_MODE,
+        cast(int, db_settings.DB_PORT),
+        cast(str, db_settings.DB_DATABASE),
     )
 
 
@@ -378,7 +391,8 @@ async def whoami(user: CurrentUser) -> WhoAmIResponse:
         organisation=user.organisation,
         roles=list(user.roles),
     )
-    logger.debug("whoami", extra={"roles_count": len(payload.roles)})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("whoami", extra={"roles_count": len(payload.roles)})
     return payload
 
 
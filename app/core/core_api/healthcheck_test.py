@@ -46,3 +46,38 @@ def test_collect_liveness_checks_does_not_probe_external_dependencies(monkeypatc
     assert result["app"].status == "ok"
     assert result["app"].message == "application settings loaded"
     assert list(result) == ["app"]
+
+
+def test_serialize_health_config_dumps_like_validated_model(monkeypatch) -> None:
+    from app.config import AppSettings, DbSettings
+
+    db_settings = DbSettings(DB_ENABLED=True, DB_PORT=5432, DB_DATABASE="app", DB_USERNAME="u", DB_PASSWORD="p")
+    monkeypatch.setattr(healthcheck, "get_db_settings", lambda: db_settings)
+    monkeypatch.setattr(healthcheck, "get_app_settings", AppSettings)
+
+    config = healthcheck._serialize_health_config()
+
+    assert config is not None
+    expected = healthcheck.HealthConfig.model_validate(config.model_dump())
+    assert config.model_dump(by_alias=True) == expected.model_dump(by_alias=True)
+    assert config.db.port == 5432
+    assert config.db.database == "app"
+
+
+def test_serialize_health_config_reuses_config_for_same_settings(monkeypatch) -> None:
+    from app.config import AppSettings, DbSettings
+
+    db_settings = DbSettings(DB_ENABLED=True, DB_PORT=5432, DB_DATABASE="app", DB_USERNAME="u", DB_PASSWORD="p")
+    monkeypatch.setattr(healthcheck, "get_db_settings", lambda: db_settings)
+    monkeypatch.setattr(healthcheck, "get_app_settings", AppSettings)
+
+    first = healthcheck._serialize_health_config()
+    assert healthcheck._serialize_health_config() is first
+
+    other_db = DbSettings(DB_ENABLED=True, DB_PORT=6543, DB_DATABASE="app", DB_USERNAME="u", DB_PASSWORD="p")
+    monkeypatch.setattr(healthcheck, "get_db_settings", lambda: other_db)
+    changed = healthcheck._serialize_health_config()
+
+    assert changed is not first
+    assert changed is not None
+    assert changed.db.port == 6543
@@ -10,6 +10,7 @@ from .deps import (
     require_legal,
     require_read,
     require_write,
+    reset_user_cache,
 )
 from .models import UserClaims
 from .service import DecodedToken, JWTAuthService, get_jwt_service, reset_jwt_service
@@ -18,6 +19,7 @@ __all__ = [
     "get_current_user",
     "get_optional_user",
     "get_value_from_jwt",
+    "reset_user_cache",
     "CurrentUser",
     "require_read",
     "require_write",
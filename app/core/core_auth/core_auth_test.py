@@ -16,21 +16,26 @@ Coverage targets:
 from __future__ import annotations
 
 import asyncio
+import json
 import time
-from typing import Any
+from collections.abc import Callable
+from typing import Any, cast
 from unittest.mock import MagicMock, patch
 
 import jwt
 import pytest
 from app.core.core_auth.acl import Perm, ResourceACL, check_acl, require_acl_perm
-from app.core.core_auth.deps import get_current_user, require_roles
+from app.core.core_auth.deps import get_current_user, require_roles, reset_user_cache
+from app.core.core_auth.keys import get_jwks_client, prefetch_jwks, reset_jwks_client
 from app.core.core_auth.models import UserClaims
 from app.core.core_auth.roles import extract_groups, extract_roles, get_effective_roles, parse_hierarchy
 from app.core.core_auth.service import JWTAuthService
-from app.core.core_auth.settings import AuthSettings, RoleSettings
+from app.core.core_auth.settings import AuthSettings, RoleSettings, reload_role_settings
+from app.core.core_auth.utils import extract_str_values, strip_prefix
 from app.shared.types import JSONValue
 from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi import HTTPException
+from pydantic import SecretStr
 
 # ---------------------------------------------------------------------------
 # Shared RSA key pair (module-scoped — generated once per test run)
@@ -47,6 +52,28 @@ def rsa_public_key(rsa_key):
     return rsa_key.public_key()
 
 
+@pytest.fixture
+def jwks_settings():
+    return AuthSettings(JWKS_URL="https://idp.example.com/jwks.json")
+
+
+@pytest.fixture
+def jwks_client(jwks_settings):
+    """A fresh singleton JWKS client built from *jwks_settings*."""
+    reset_jwks_client()
+    with patch("app.core.core_auth.keys.get_auth_settings", return_value=jwks_settings):
+        client = get_jwks_client()
+    yield client
+    reset_jwks_client()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_token_caches():
+    reset_user_cache()
+    yield
+    reset_user_cache()
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -87,7 +114,7 @@ def _jwks_service(private_key: Any, **settings_overrides: Any) -> tuple[JWTAuthS
     mock_signing_key = MagicMock()
     mock_signing_key.key = public_key
     mock_client = MagicMock()
-    mock_client.get_signing_key_from_jwt.return_value = mock_signing_key
+    mock_client.get_signing_key.return_value = mock_signing_key
 
     settings = AuthSettings(
         MODE="jwks",
@@ -132,6 +159,122 @@ class TestAuthSettings:
         settings = AuthSettings(ALGORITHMS="")
         assert settings.ALGORITHMS == ["RS256"]
 
+    @pytest.mark.parametrize(
+        "jwks_settings", [AuthSettings(JWKS_URL="https://idp.example.com/jwks.json", JWKS_MIN_TTL=900)]
+    )
+    def test_jwks_client_uses_configured_min_ttl(self, jwks_client: jwt.PyJWKClient) -> None:
+        assert jwks_client.jwk_set_cache is not None
+        assert jwks_client.jwk_set_cache.lifespan == 900
+
+    def test_ssl_context_is_shared_per_verify_mode(self) -> None:
+        import ssl
+
+        from app.core.core_auth.keys import _build_ssl_context
+
+        strict = AuthSettings(DISABLE_SSL_VERIFY=False)
+        lax = AuthSettings(DISABLE_SSL_VERIFY=True)
+        with patch("app.core.core_auth.keys.get_auth_settings", return_value=strict):
+            first = _build_ssl_context()
+            assert _build_ssl_context() is first
+        with patch("app.core.core_auth.keys.get_auth_settings", return_value=lax):
+            unverified = _build_ssl_context()
+        assert first.verify_mode == ssl.CERT_REQUIRED
+        assert unverified.verify_mode == ssl.CERT_NONE
+
+    def test_jwks_client_fetches_once_for_concurrent_lookups(self, rsa_key: Any, jwks_client: jwt.PyJWKClient) -> None:
+        import threading
+
+        jwk = jwt.algorithms.RSAAlgorithm.to_jwk(rsa_key.public_key(), as_dict=True)
+        jwk["kid"] = "k1"
+        cache = jwks_client.jwk_set_cache
+        assert cache is not None
+        fetches: list[int] = []
+
+        def _fetch() -> dict[str, Any]:
+            fetches.append(1)
+            time.sleep(0.05)
+            cache.put(cast(Any, {"keys": [jwk]}))
+            return {"keys": [jwk]}
+
+        with patch.object(jwks_client, "fetch_data", side_effect=_fetch):
+            threads = [threading.Thread(target=jwks_client.get_signing_key, args=("k1",)) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert len(fetches) == 1
+
+    def test_jwks_kid_index_follows_key_set_rotation(self, rsa_key: Any, jwks_client: jwt.PyJWKClient) -> None:
+        jwk = jwt.algorithms.RSAAlgorithm.to_jwk(rsa_key.public_key(), as_dict=True)
+        old_key, new_key = {**jwk, "kid": "old"}, {**jwk, "kid": "new"}
+        cache = jwks_client.jwk_set_cache
+        assert cache is not None
+
+        def _serve(payload: dict[str, Any]) -> Callable[[], dict[str, Any]]:
+            # Like PyJWKClient.fetch_data, store the fetched payload in the JWK set cache
+            # (which takes the raw dict despite its PyJWKSet annotation).
+            def _fetch() -> dict[str, Any]:
+                cache.put(cast(Any, payload))
+                return payload
+
+            return _fetch
+
+        with patch.object(jwks_client, "fetch_data", side_effect=_serve({"keys": [old_key]})):
+            assert jwks_client.get_signing_key("old").key_id == "old"
+        with patch.object(jwks_client, "fetch_data", side_effect=_serve({"keys": [new_key]})):
+            jwks_client.get_jwk_set(refresh=True)
+            assert jwks_client.get_signing_key("new").key_id == "new"
+            with pytest.raises(jwt.PyJWKClientError):
+                jwks_client.get_signing_key("old")
+
+    def test_jwks_client_parses_each_fetched_key_set_once(self, rsa_key: Any, jwks_client: jwt.PyJWKClient) -> None:
+        jwk = jwt.algorithms.RSAAlgorithm.to_jwk(rsa_key.public_key(), as_dict=True)
+        jwk["kid"] = "k1"
+        cache = jwks_client.jwk_set_cache
+        assert cache is not None
+        cache.put(cast(Any, {"keys": [jwk]}))
+
+        with patch("app.core.core_auth.keys.PyJWKSet.from_dict", wraps=jwt.PyJWKSet.from_dict) as from_dict:
+            first = jwks_client.get_signing_key("k1")
+            assert jwks_client.get_signing_key("k1") is first
+            assert jwks_client.get_jwk_set() is jwks_client.get_jwk_set()
+        from_dict.assert_called_once()
+
+    def test_prefetch_jwks_fetches_key_set_in_jwks_mode(self) -> None:
+        settings = AuthSettings(MODE="jwks", JWKS_URL="https://idp.example.com/jwks.json")
+        client = MagicMock()
+        with (
+            patch("app.core.core_auth.keys.get_auth_settings", return_value=settings),
+            patch("app.core.core_auth.keys.get_jwks_client", return_value=client),
+        ):
+            assert asyncio.run(prefetch_jwks()) is True
+        client.get_jwk_set.assert_called_once_with()
+
+    def test_prefetch_jwks_swallows_unexpected_errors(self) -> None:
+        settings = AuthSettings(MODE="jwks", JWKS_URL="https://idp.example.com/jwks.json")
+        client = MagicMock()
+        client.get_jwk_set.side_effect = json.JSONDecodeError("Expecting value", "<html>", 0)
+        with (
+            patch("app.core.core_auth.keys.get_auth_settings", return_value=settings),
+            patch("app.core.core_auth.keys.get_jwks_client", return_value=client),
+        ):
+            assert asyncio.run(prefetch_jwks()) is False
+
+    def test_prefetch_jwks_gives_up_after_timeout(self) -> None:
+        settings = AuthSettings(MODE="jwks", JWKS_URL="https://idp.example.com/jwks.json")
+        client = MagicMock()
+        client.get_jwk_set.side_effect = lambda: time.sleep(0.2)
+        with (
+            patch("app.core.core_auth.keys.get_auth_settings", return_value=settings),
+            patch("app.core.core_auth.keys.get_jwks_client", return_value=client),
+            patch("app.core.core_auth.keys._PREFETCH_TIMEOUT", 0.01),
+        ):
+            assert asyncio.run(prefetch_jwks()) is False
+
+    def test_prefetch_jwks_skips_hs_mode(self) -> None:
+        with patch("app.core.core_auth.keys.get_auth_settings", return_value=AuthSettings(MODE="hs")):
+            assert asyncio.run(prefetch_jwks()) is False
+
 
 # ---------------------------------------------------------------------------
 # models
@@ -157,6 +300,14 @@ class TestUserClaims:
         user = UserClaims(sub="  uuid-1  ")
         assert user.sub == "uuid-1"
 
+    def test_claims_are_frozen_and_ignore_unknown_fields(self) -> None:
+        from pydantic import ValidationError
+
+        user = UserClaims.model_validate({"sub": "x", "unknown_claim": "value"})
+        assert "unknown_claim" not in user.model_dump()
+        with pytest.raises(ValidationError):
+            user.sub = "y"  # type: ignore[misc]
+
 
 # ---------------------------------------------------------------------------
 # roles
@@ -202,6 +353,25 @@ class TestExtractRoles:
         assert "portal_user" in result
         assert not any(r.startswith("grps_") for r in result)
 
+    def test_extract_str_values_skips_nested_and_blank_items(self) -> None:
+        assert extract_str_values([" a ", "", 7, ["x"], {"k": "v"}, None]) == ["a", "7", "None"]
+        assert extract_str_values("  ") == []
+
+    @pytest.mark.parametrize("prefix", ["", "GRPS_", "grps_"])
+    @pytest.mark.parametrize("role", ["GRPS_Admin", "grps_admin", " Viewer ", "GRPS_", "other"])
+    def test_normalize_role_matches_strip_prefix(self, prefix: str, role: str) -> None:
+        normalize = RoleSettings(PREFIX=prefix).normalize_role
+        assert normalize(role) == strip_prefix(role, prefix).strip().lower()
+
+    def test_role_settings_are_frozen(self) -> None:
+        from pydantic import ValidationError
+
+        cfg = RoleSettings(PREFIX="GRPS_")
+        with pytest.raises(ValidationError):
+            cfg.PREFIX = "other_"  # type: ignore[misc]
+        assert cfg.normalize_role is cfg.normalize_role
+        assert cfg.normalize_role("GRPS_Admin") == "admin"
+
     def test_deduplication_across_sources(self) -> None:
         payload = _as_json({"sub": "u", "roles": ["viewer"], "groups": ["viewer"]})
         with patch("app.core.core_auth.roles.get_role_settings", return_value=RoleSettings(PREFIX="")):
@@ -227,6 +397,50 @@ class TestJWTAuthServiceValidation:
             decoded = svc.decode_token(token)
         assert decoded["payload"]["sub"] == "user-abc123"
 
+    def test_mode_is_case_insensitive(self) -> None:
+        svc = JWTAuthService(AuthSettings(MODE="HS", HS_SECRET="s" * 32, VERIFY_ISS=False, VERIFY_AUD=False))
+        token = jwt.encode(_payload(), "s" * 32, algorithm="HS256")
+        assert svc.decode_token(token)["payload"]["sub"] == "user-abc123"
+
+    def test_mode_follows_settings_copies(self) -> None:
+        base = AuthSettings(MODE="jwks", HS_SECRET="s" * 32, VERIFY_ISS=False, VERIFY_AUD=False)
+        token = jwt.encode(_payload(), "s" * 32, algorithm="HS256")
+        with pytest.raises(HTTPException):
+            JWTAuthService(base).decode_token(token)
+        svc = JWTAuthService(base.model_copy(update={"MODE": "hs"}))
+        assert svc.decode_token(token)["payload"]["sub"] == "user-abc123"
+
+    def test_missing_hs_secret_raises_500(self) -> None:
+        svc = JWTAuthService(AuthSettings(MODE="hs", HS_SECRET=""))
+        with pytest.raises(HTTPException) as exc:
+            svc.decode_token(jwt.encode(_payload(), "s" * 32, algorithm="HS256"))
+        assert exc.value.detail == "auth_hs_secret_missing"
+
+    def test_hs_secret_follows_settings_copies(self) -> None:
+        base = AuthSettings(MODE="hs", HS_SECRET="a" * 32, VERIFY_ISS=False, VERIFY_AUD=False)
+        JWTAuthService(base).decode_token(jwt.encode(_payload(), "a" * 32, algorithm="HS256"))
+        rotated = base.model_copy(update={"HS_SECRET": SecretStr("b" * 32)})
+        token = jwt.encode(_payload(), "b" * 32, algorithm="HS256")
+        assert JWTAuthService(rotated).decode_token(token)["payload"]["sub"] == "user-abc123"
+
+    def test_unknown_mode_raises_500(self, rsa_key: Any) -> None:
+        svc = JWTAuthService(AuthSettings(MODE="saml"))
+        with pytest.raises(HTTPException) as exc:
+            svc.decode_token(_rs256_token(rsa_key, _payload()))
+        assert exc.value.status_code == 500
+        assert exc.value.detail == "auth_mode_invalid"
+
+    def test_decode_kwargs_built_once_per_service(self, rsa_key: Any) -> None:
+        svc, mock_client = _jwks_service(rsa_key)
+        token = _rs256_token(rsa_key, _payload())
+        with (
+            patch("app.core.core_auth.service.get_jwks_client", return_value=mock_client),
+            patch.object(JWTAuthService, "_build_decode_kwargs", wraps=svc._build_decode_kwargs) as build,
+        ):
+            svc.decode_token(token)
+            svc.decode_token(token)
+        assert build.call_count == 1
+
     def test_expired_token_raises_401(self, rsa_key: Any) -> None:
         svc, mock_client = _jwks_service(rsa_key)
         token = _rs256_token(rsa_key, _payload(exp=int(time.time()) - 3600))
@@ -304,6 +518,19 @@ class TestAlgorithmConfusion:
         assert exc.value.status_code == 401
         assert exc.value.detail == "alg_none_forbidden"
 
+    @pytest.mark.parametrize("alg", ["None", "NONE", "nOnE"])
+    def test_alg_none_rejected_in_any_case(self, alg: str) -> None:
+        import base64
+        import json
+
+        svc = JWTAuthService(settings=AuthSettings(VALIDATE_SIGNATURE=False))
+        header = base64.urlsafe_b64encode(json.dumps({"alg": alg}).encode()).rstrip(b"=").decode()
+        payload_b64 = base64.urlsafe_b64encode(json.dumps(_payload()).encode()).rstrip(b"=").decode()
+
+        with pytest.raises(HTTPException) as exc:
+            svc.decode_token(f"{header}.{payload_b64}.")
+        assert exc.value.detail == "alg_none_forbidden"
+
     def test_hs256_token_rejected_in_jwks_mode(self, rsa_key: Any) -> None:
         """A HS256-signed token must be rejected when the service is in JWKS mode.
 
@@ -361,6 +588,24 @@ class TestNoValidationMode:
             svc.decode_token("not.a.token")
         assert exc.value.status_code == 401
 
+    @pytest.mark.parametrize("token", ["eyJhbGciOiJSUzI1NiJ9", "eyJhbGciOiJSUzI1NiJ9.e30"])
+    def test_token_without_three_segments_is_invalid_header(self, token: str) -> None:
+        svc = JWTAuthService(settings=AuthSettings(VALIDATE_SIGNATURE=False))
+        with pytest.raises(HTTPException) as exc:
+            svc.decode_token(token)
+        assert exc.value.detail == "invalid_header"
+
+    def test_header_segment_parsed_once_for_tokens_sharing_it(self, rsa_key: Any) -> None:
+        from app.core.core_auth.service import _parse_header_segment
+
+        svc = JWTAuthService(settings=AuthSettings(VALIDATE_SIGNATURE=False))
+        _parse_header_segment.cache_clear()
+        svc.decode_token(_rs256_token(rsa_key, _payload(sub="a")))
+        decoded = svc.decode_token(_rs256_token(rsa_key, _payload(sub="b")))
+        info = _parse_header_segment.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert decoded["header"]["alg"] == "RS256"
+
 
 # ---------------------------------------------------------------------------
 # deps
@@ -373,11 +618,6 @@ class TestGetCurrentUser:
         request.headers = {"Authorization": auth_header} if auth_header else {}
         return request
 
-    def _make_creds(self) -> MagicMock:
-        creds = MagicMock()
-        creds.credentials = "irrelevant"
-        return creds
-
     def test_missing_header_raises_401(self) -> None:
         request = self._make_request(None)
         with pytest.raises(HTTPException) as exc:
@@ -387,7 +627,7 @@ class TestGetCurrentUser:
     def test_non_bearer_scheme_raises_401(self) -> None:
         request = self._make_request("Basic dXNlcjpwYXNz")
         with pytest.raises(HTTPException) as exc:
-            asyncio.run(get_current_user(request, self._make_creds()))
+            asyncio.run(get_current_user(request, None))
         assert exc.value.status_code == 401
 
     def test_valid_token_returns_user_claims(self, rsa_key: Any) -> None:
@@ -397,7 +637,7 @@ class TestGetCurrentUser:
 
         async def _run() -> UserClaims:
             with patch("app.core.core_auth.deps.validate_jwt", return_value=valid_payload):
-                return await get_current_user(request, self._make_creds())
+                return await get_current_user(request, None)
 
         user = asyncio.run(_run())
         assert user.sub == valid_payload["sub"]
@@ -407,12 +647,83 @@ class TestGetCurrentUser:
 
         async def _run() -> None:
             with patch("app.core.core_auth.deps.validate_jwt", side_effect=HTTPException(401, "invalid_token")):
-                await get_current_user(request, self._make_creds())
+                await get_current_user(request, None)
 
         with pytest.raises(HTTPException) as exc:
             asyncio.run(_run())
         assert exc.value.status_code == 401
 
+    def test_optional_claims_use_fallback_keys(self) -> None:
+        request = self._make_request("Bearer fallback.claims.token")
+        payload = _payload(email=" ", mail=" user@example.org ", org="acme", mandantId="m-1")
+        del payload["name"]
+
+        async def _run() -> UserClaims:
+            with patch("app.core.core_auth.deps.validate_jwt", return_value=payload):
+                return await get_current_user(request, None)
+
+        user = asyncio.run(_run())
+        assert user.email == "user@example.org"
+        assert user.name is None
+        assert user.organisation == "acme"
+        assert user.mandant_id == "m-1"
+
+    def test_repeated_token_skips_validation(self) -> None:
+        request = self._make_request("Bearer cached.token.value")
+
+        async def _run() -> tuple[UserClaims, UserClaims, int]:
+            with patch("app.core.core_auth.deps.validate_jwt", return_value=_payload()) as validate:
+                first = await get_current_user(request, None)
+                second = await get_current_user(request, None)
+                return first, second, validate.call_count
+
+        first, second, calls = asyncio.run(_run())
+        assert second is first
+        assert calls == 1
+
+    def test_reloading_settings_drops_cached_users(self) -> None:
+        request = self._make_request("Bearer cached.token.value")
+
+        async def _run() -> int:
+            with patch("app.core.core_auth.deps.validate_jwt", return_value=_payload()) as validate:
+                await get_current_user(request, None)
+                reload_role_settings()
+                await get_current_user(request, None)
+                return validate.call_count
+
+        assert asyncio.run(_run()) == 2
+
+    def test_cached_user_is_not_served_past_exp(self) -> None:
+        request = self._make_request("Bearer expiring.token.value")
+        expired = _payload(exp=int(time.time()) - 1)
+
+        async def _run() -> int:
+            with patch("app.core.core_auth.deps.validate_jwt", return_value=expired) as validate:
+                await get_current_user(request, None)
+                await get_current_user(request, None)
+                return validate.call_count
+
+        assert asyncio.run(_run()) == 2
+
+
+class TestBearerScheme:
+    def test_openapi_documents_bearer_and_header_is_parsed_directly(self) -> None:
+        from fastapi import Depends, FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+
+        @app.get("/me")
+        async def me(user: UserClaims = Depends(get_current_user)) -> dict[str, str]:
+            return {"sub": user.sub}
+
+        client = TestClient(app)
+        schemes = client.get("/openapi.json").json()["components"]["securitySchemes"]
+        assert schemes["HTTPBearer"]["scheme"] == "bearer"
+        with patch("app.core.core_auth.deps.validate_jwt", return_value=_payload()):
+            response = client.get("/me", headers={"Authorization": "Bearer a.b.c"})
+        assert response.json() == {"sub": "user-abc123"}
+
 
 class TestRequireRoles:
     def _user(self, roles: list[str]) -> UserClaims:
@@ -452,6 +763,21 @@ class TestRequireRoles:
         user = asyncio.run(_run())
         assert user.sub == "u"
 
+    def test_roles_inactive_still_requires_authentication(self) -> None:
+        from fastapi import Depends, FastAPI
+        from fastapi.testclient import TestClient
+
+        app = FastAPI()
+        dep = require_roles(lambda _cfg: ["admin"])
+
+        @app.get("/guarded")
+        async def guarded(user: UserClaims = Depends(dep)) -> dict[str, str]:
+            return {"sub": user.sub}
+
+        with patch("app.core.core_auth.deps.get_role_settings", return_value=RoleSettings(ACTIVE=False)):
+            response = TestClient(app).get("/guarded")
+        assert response.status_code == 401
+
 
 # ---------------------------------------------------------------------------
 # parse_hierarchy
@@ -914,3 +1240,62 @@ class TestRequireACLPerm:
 
         result: UserClaims = asyncio.run(_run())
         assert result.sub == "charlie"
+
+
+# ---------------------------------------------------------------------------
+# require_roles — cached requirements
+# ---------------------------------------------------------------------------
+
+
+class TestRequireRolesCaching:
+    def test_resolver_runs_once_per_settings_instance(self) -> None:
+        cfg = RoleSettings(ACTIVE=True, ADMIN_ROLES=["admin"])
+        calls: list[RoleSettings] = []
+
+        def resolver(c: RoleSettings) -> list[str]:
+            calls.append(c)
+            return [" Admin "]
+
+        dep = require_roles(resolver)
+
+        async def _run() -> None:
+            with patch("app.core.core_auth.deps.get_role_settings", return_value=cfg):
+                await dep(UserClaims(sub="u", roles=["admin"]))
+                await dep(UserClaims(sub="u", roles=["admin"]))
+
+        asyncio.run(_run())
+        assert calls == [cfg]
+
+    def test_new_settings_instance_recomputes_requirement(self) -> None:
+        dep = require_roles(lambda c: c.ADMIN_ROLES)
+        first = RoleSettings(ACTIVE=True, ADMIN_ROLES=["admin"])
+        second = RoleSettings(ACTIVE=True, ADMIN_ROLES=["owner"])
+
+        async def _run(cfg: RoleSettings, roles: list[str]) -> UserClaims:
+            with patch("app.core.core_auth.deps.get_role_settings", return_value=cfg):
+                return await dep(UserClaims(sub="u", roles=roles))
+
+        asyncio.run(_run(first, ["admin"]))
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(_run(second, ["admin"]))
+        assert exc.value.status_code == 403
+        detail = cast(dict[str, Any], exc.value.detail)
+        assert detail["required_roles"] == ["owner"]
+
+    def test_roles_are_read_from_the_current_claims(self) -> None:
+        dep = require_roles(lambda c: c.ADMIN_ROLES)
+        cfg = RoleSettings(ACTIVE=True, ADMIN_ROLES=["admin"])
+        promoted = UserClaims(sub="u", roles=["user"]).model_copy(update={"roles": ["admin"]})
+
+        async def _run() -> UserClaims:
+            with patch("app.core.core_auth.deps.get_role_settings", return_value=cfg):
+                return await dep(promoted)
+
+        assert asyncio.run(_run()) is promoted
+
+    def test_composite_role_tuples_keep_declaration_order(self) -> None:
+        cfg = RoleSettings(READ_ROLES=["r"], WRITE_ROLES=["w"], DELETE_ROLES=["d"], ADMIN_ROLES=["a"])
+        assert cfg.write_or_admin_roles == ("w", "a")
+        assert cfg.delete_or_admin_roles == ("d", "a")
+        assert cfg.any_roles == ("r", "w", "d", "a")
+        assert cfg.any_roles is cfg.any_roles
@@ -2,23 +2,40 @@ from __future__ import annotations
 
 """FastAPI dependencies for JWT authentication and RBAC."""
 
+import time
 from collections.abc import Awaitable, Callable, Iterable, Mapping
 from datetime import UTC, datetime
+from functools import lru_cache
+from operator import attrgetter
 from typing import Annotated, NoReturn
 
+from app.core.core_cache import MemoryTTLCache
 from app.core.core_messages import MessageKeys, msg
 from app.shared.types import JSONValue
 from fastapi import Depends, HTTPException, Request, Security, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi.security import HTTPBearer
 
 from .models import UserClaims
 from .roles import extract_groups, extract_roles, get_effective_roles
-from .settings import RoleSettings, get_role_settings
-from .utils import has_any
+from .settings import RoleSettings, get_auth_settings, get_role_settings
+from .utils import token_expiry
 from .validators import validate_jwt
 
-bearer = HTTPBearer(auto_error=False)
-Credentials = Annotated[HTTPAuthorizationCredentials | None, Security(bearer)]
+
+class _DocumentedBearer(HTTPBearer):
+    """HTTP bearer scheme used only so OpenAPI documents the security requirement.
+
+    The Authorization header is parsed by :func:`_extract_token`, so the
+    per-request call skips HTTPBearer's parsing and credentials model.
+    """
+
+    async def __call__(self, request: Request) -> None:
+        return None
+
+
+bearer = _DocumentedBearer(scheme_name="HTTPBearer", auto_error=False)
+# Always resolves to None; the token is read from the request itself.
+Credentials = Annotated[None, Security(bearer)]
 RoleResolver = Callable[[RoleSettings], Iterable[str]]
 
 
@@ -42,15 +59,11 @@ def _raise_auth_error(
     raise HTTPException(status_code=status_code, detail=payload, headers=headers)
 
 
-def _ordered_roles(roles: Iterable[str]) -> list[str]:
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for role in roles:
-        normalized = role.strip().lower()
-        if normalized and normalized not in seen:
-            seen.add(normalized)
-            ordered.append(normalized)
-    return ordered
+def _ordered_roles(roles: Iterable[str]) -> tuple[str, ...]:
+    # Built-in resolvers return RoleSettings lists that are already trimmed and
+    # lowercased; custom resolvers may not, so normalize here (once per settings
+    # instance, see require_roles).
+    return tuple(dict.fromkeys(normalized for role in roles if (normalized := role.strip().lower())))
 
 
 def _validate_bearer_scheme(scheme: str, required: bool) -> bool:
@@ -134,12 +147,13 @@ def _extract_claim(payload: Mapping[str, JSONValue], *keys: str) -> str | None:
     return None
 
 
-async def get_value_from_jwt(key: str, creds: Credentials) -> str | None:
+async def get_value_from_jwt(key: str, request: Request) -> str | None:
     """Return a claim value from the JWT without failing the request."""
-    if not creds:
+    token = _extract_token(request, required=False)
+    if not token:
         return None
     try:
-        payload = validate_jwt(creds.credentials)
+        payload = validate_jwt(token)
     except HTTPException:
         return None
     value = payload.get(key)
@@ -148,25 +162,68 @@ async def get_value_from_jwt(key: str, creds: Credentials) -> str | None:
     return str(value) if value is not None else None
 
 
+# Optional UserClaims fields and the JWT claims they are read from, in priority order.
+_USER_CLAIM_KEYS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("email", ("email", "mail")),
+    ("name", ("name", "given_name", "family_name")),
+    ("preferred_username", ("preferred_username", "username")),
+    ("organisation", ("organisation", "org", "tenant")),
+    ("mandant_id", ("mandant_id", "mandantId")),
+)
+
+
 def _build_user(payload: Mapping[str, JSONValue], sub: str) -> UserClaims:
-    return UserClaims(
-        sub=sub,
-        roles=extract_roles(payload),
-        groups=extract_groups(payload),
-        email=_extract_claim(payload, "email", "mail"),
-        name=_extract_claim(payload, "name", "given_name", "family_name"),
-        preferred_username=_extract_claim(payload, "preferred_username", "username"),
-        organisation=_extract_claim(payload, "organisation", "org", "tenant"),
-        mandant_id=_extract_claim(payload, "mandant_id", "mandantId"),
-    )
+    get = payload.get
+    claims: dict[str, str | None] = {}
+    for field, keys in _USER_CLAIM_KEYS:
+        found: str | None = None
+        for key in keys:
+            value = get(key)
+            if isinstance(value, str) and (stripped := value.strip()):
+                found = stripped
+                break
+        claims[field] = found
+    return UserClaims(sub=sub, roles=extract_roles(payload), groups=extract_groups(payload), **claims)
+
+
+@lru_cache(maxsize=1)
+def _user_cache() -> MemoryTTLCache[str, tuple[UserClaims, float | None]]:
+    settings = get_auth_settings()
+    return MemoryTTLCache(ttl_seconds=settings.TOKEN_CACHE_TTL, max_entries=settings.TOKEN_CACHE_MAX_ENTRIES)
+
+
+def reset_user_cache() -> None:
+    """Drop cached users and rebuild the cache from AuthSettings on next use (used in tests)."""
+    _user_cache.cache_clear()
+
+
+def _cached_user(token: str) -> UserClaims | None:
+    """Return the user built for *token* within the last AUTH_TOKEN_CACHE_TTL seconds."""
+    cache = _user_cache()
+    entry = cache.get(token)
+    if entry is None:
+        return None
+    user, expires_at = entry
+    if expires_at is not None and expires_at <= time.time():
+        cache.invalidate(token)
+        return None
+    return user
+
+
+def _remember_user(token: str, payload: Mapping[str, JSONValue], user: UserClaims) -> None:
+    # Never serve a cached user past the token's own `exp`, even inside the cache TTL.
+    _user_cache().set(token, (user, token_expiry(payload)))
 
 
 async def get_current_user(request: Request, creds: Credentials) -> UserClaims:
     """Return the authenticated user or raise 401."""
-    _ = creds  # ensure FastAPI documents the HTTP bearer security scheme
+    _ = creds  # only present so FastAPI documents the HTTP bearer security scheme
     token = _extract_token(request, required=True)
     if token is None:
         _raise_auth_error(msg.get(MessageKeys.AUTH_TOKEN_EXTRACTION_FAILED), code="AUTH_EXTRACTION_FAILED")
+    cached = _cached_user(token)
+    if cached is not None:
+        return cached
     try:
         payload = validate_jwt(token)
     except HTTPException as exc:
@@ -174,7 +231,9 @@ async def get_current_user(request: Request, creds: Credentials) -> UserClaims:
     sub = _extract_claim(payload, "sub")
     if not sub:
         _raise_auth_error(msg.get(MessageKeys.AUTH_INVALID_TOKEN), code="AUTH_TOKEN_INVALID")
-    return _build_user(payload, sub)
+    user = _build_user(payload, sub)
+    _remember_user(token, payload, user)
+    return user
 
 
 async def get_optional_user(request: Request, creds: Credentials) -> UserClaims | None:
@@ -183,6 +242,9 @@ async def get_optional_user(request: Request, creds: Credentials) -> UserClaims
     token = _extract_token(request, required=False)
     if not token:
         return None
+    cached = _cached_user(token)
+    if cached is not None:
+        return cached
     try:
         payload = validate_jwt(token)
     except HTTPException:
@@ -190,7 +252,9 @@ async def get_optional_user(request: Request, creds: Credentials) -> UserClaims
     sub = _extract_claim(payload, "sub")
     if not sub:
         return None
-    return _build_user(payload, sub)
+    user = _build_user(payload, sub)
+    _remember_user(token, payload, user)
+    return user
 
 
 CurrentUser = Annotated[UserClaims, Depends(get_current_user)]
@@ -201,21 +265,33 @@ def require_roles(
 ) -> Callable[[UserClaims], Awaitable[UserClaims]]:
     """FastAPI dependency enforcing role-based access."""
 
+    # Role settings are immutable once loaded, so the normalized requirement is
+    # computed once per settings instance. The instance itself is kept (not its id)
+    # so a reloaded settings object can never alias a stale entry.
+    cached: tuple[RoleSettings, tuple[str, ...], frozenset[str]] | None = None
+
+    def required_for(cfg: RoleSettings) -> tuple[tuple[str, ...], frozenset[str]]:
+        nonlocal cached
+        if cached is None or cached[0] is not cfg:
+            ordered = _ordered_roles(resolver(cfg))
+            cached = (cfg, ordered, frozenset(ordered))
+        return cached[1], cached[2]
+
     async def dependency(user: CurrentUser) -> UserClaims:
         cfg = get_role_settings()
         if not cfg.ACTIVE:
             return user
-        required_list = _ordered_roles(resolver(cfg))
-        required_set = set(required_list)
+        required_list, required_set = required_for(cfg)
+        # Both sides are already normalized, so a plain set check replaces has_any().
         effective = get_effective_roles(user.roles, cfg)
-        if not required_set or has_any(effective, required_set):
+        if not required_set or not required_set.isdisjoint(effective):
             return user
         message = detail if detail and detail != "forbidden" else msg.get(MessageKeys.AUTH_INSUFFICIENT_PERMISSIONS)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail={
                 "detail": message,
-                "required_roles": required_list,
+                "required_roles": list(required_list),
                 "user_roles": list(user.roles),
                 "timestamp": _timestamp(),
             },
@@ -224,16 +300,17 @@ def require_roles(
     return dependency
 
 
-require_read = require_roles(lambda cfg: cfg.READ_ROLES)
-require_write = require_roles(lambda cfg: [*cfg.WRITE_ROLES, *cfg.ADMIN_ROLES])
-require_delete = require_roles(lambda cfg: [*cfg.DELETE_ROLES, *cfg.ADMIN_ROLES])
-require_admin = require_roles(lambda cfg: cfg.ADMIN_ROLES)
+require_read = require_roles(attrgetter("READ_ROLES"))
+require_write = require_roles(attrgetter("write_or_admin_roles"))
+require_delete = require_roles(attrgetter("delete_or_admin_roles"))
+require_admin = require_roles(attrgetter("ADMIN_ROLES"))
 require_legal = require_admin
-require_any = require_roles(lambda cfg: [*cfg.READ_ROLES, *cfg.WRITE_ROLES, *cfg.DELETE_ROLES, *cfg.ADMIN_ROLES])
+require_any = require_roles(attrgetter("any_roles"))
 
 __all__ = [
     "get_current_user",
     "get_optional_user",
+    "reset_user_cache",
     "get_value_from_jwt",
     "CurrentUser",
     "require_read",
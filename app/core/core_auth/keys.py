@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import ssl
+import threading
 from functools import lru_cache
 
-from jwt import PyJWKClient
+from jwt import PyJWK, PyJWKClient, PyJWKClientError, PyJWKSet
 
 from .settings import get_auth_settings
 
+logger = logging.getLogger("app_logger")
 
-def _build_ssl_context() -> ssl.SSLContext:
+# Upper bound on how long startup waits for the JWKS prefetch.
+_PREFETCH_TIMEOUT = 5.0
+
+
+@lru_cache(maxsize=2)
+def _ssl_context(verify: bool) -> ssl.SSLContext:
+    # create_default_context() loads the system CA bundle; build it once per
+    # verify mode and share it across JWKS clients.
     ctx = ssl.create_default_context()
-    if get_auth_settings().DISABLE_SSL_VERIFY:
+    if not verify:
         ctx.check_hostname = False
         ctx.verify_mode = ssl.CERT_NONE
     ctx.minimum_version = ssl.TLSVersion.TLSv1_2
@@ -20,9 +31,71 @@ def _build_ssl_context() -> ssl.SSLContext:
     return ctx
 
 
+def _build_ssl_context() -> ssl.SSLContext:
+    return _ssl_context(not get_auth_settings().DISABLE_SSL_VERIFY)
+
+
+class _SerializedJWKClient(PyJWKClient):
+    """PyJWKClient whose lookups run one at a time and parse each key set once.
+
+    When the cached key set expires (or an unknown ``kid`` forces a refresh),
+    one caller fetches the set and concurrent callers wait and reuse it
+    instead of each issuing their own request to the identity provider.
+    """
+
+    def __init__(self, uri: str, **kwargs: object) -> None:
+        super().__init__(uri, **kwargs)  # type: ignore[arg-type]
+        self._refresh_lock = threading.RLock()
+        # Parsed form of the payload last returned by the JWK set cache (or a fetch),
+        # plus its signing keys by kid. Rebuilt whenever that payload object changes,
+        # so keys dropped by the identity provider stop resolving after the next refresh.
+        self._parsed_payload: object = None
+        self._parsed_set: PyJWKSet | None = None
+        self._keys_by_kid: dict[str, PyJWK] = {}
+
+    def _parse(self, payload: object) -> PyJWKSet:
+        if payload is self._parsed_payload and self._parsed_set is not None:
+            return self._parsed_set
+        if isinstance(payload, PyJWKSet):
+            jwk_set = payload
+        elif isinstance(payload, dict):
+            jwk_set = PyJWKSet.from_dict(payload)
+        else:
+            raise PyJWKClientError("The JWKS endpoint did not return a JSON object")
+        self._keys_by_kid = {
+            key.key_id: key for key in jwk_set.keys if key.key_id and key.public_key_use in ("sig", None)
+        }
+        self._parsed_payload = payload
+        self._parsed_set = jwk_set
+        return jwk_set
+
+    def get_jwk_set(self, refresh: bool = False) -> PyJWKSet:
+        # Same flow as PyJWKClient.get_jwk_set, but the set is parsed once per
+        # payload instead of re-running PyJWKSet.from_dict on every lookup.
+        with self._refresh_lock:
+            payload = None
+            if self.jwk_set_cache is not None and not refresh:
+                payload = self.jwk_set_cache.get()
+            if payload is None:
+                payload = self.fetch_data()
+            return self._parse(payload)
+
+    def get_signing_key(self, kid: str) -> PyJWK:
+        with self._refresh_lock:
+            self.get_jwk_set()
+            key = self._keys_by_kid.get(kid)
+            if key is not None:
+                return key
+            # Unknown kid: let PyJWT refresh the set and retry once.
+            return super().get_signing_key(kid)
+
+
 @lru_cache(maxsize=1)
-def _cached_client(url: str) -> PyJWKClient:
-    return PyJWKClient(url, ssl_context=_build_ssl_context())
+def _cached_client(url: str, lifespan: int) -> PyJWKClient:
+    # PyJWT's JWK set cache holds the fetched payload (raw JSON in the locked
+    # pyjwt); the client parses it once per fetch and keeps a kid index, so a
+    # signing-key lookup is a dict hit until *lifespan* elapses.
+    return _SerializedJWKClient(url, ssl_context=_build_ssl_context(), lifespan=lifespan)
 
 
 def get_jwks_client() -> PyJWKClient:
@@ -30,7 +103,31 @@ def get_jwks_client() -> PyJWKClient:
     settings = get_auth_settings()
     if not settings.JWKS_URL:
         raise RuntimeError("AUTH_JWKS_URL missing")
-    return _cached_client(str(settings.JWKS_URL))
+    return _cached_client(str(settings.JWKS_URL), settings.JWKS_MIN_TTL)
+
+
+async def prefetch_jwks() -> bool:
+    """Fetch the JWK set in a worker thread so the first request does not block on it.
+
+    PyJWKClient fetches synchronously; without this the cold-start download
+    runs on the event loop inside the first authenticated request. The wait is
+    capped at ``_PREFETCH_TIMEOUT`` seconds so a slow identity provider cannot
+    hold up startup. Returns ``False`` when JWKS validation is not configured,
+    the fetch failed or timed out (the first request then retries as before).
+    """
+    settings = get_auth_settings()
+    if not (settings.VALIDATE_SIGNATURE and settings.MODE == "jwks" and settings.JWKS_URL):
+        return False
+    try:
+        await asyncio.wait_for(asyncio.to_thread(get_jwks_client().get_jwk_set), timeout=_PREFETCH_TIMEOUT)
+    except TimeoutError:
+        logger.warning("JWKS prefetch timed out after %ss", _PREFETCH_TIMEOUT)
+        return False
+    except Exception as exc:
+        # Startup must not fail because the identity provider is down or returns garbage.
+        logger.warning("JWKS prefetch failed: %s", exc)
+        return False
+    return True
 
 
 def reset_jwks_client() -> None:
@@ -38,4 +135,4 @@ def reset_jwks_client() -> None:
     _cached_client.cache_clear()
 
 
-__all__ = ["get_jwks_client", "reset_jwks_client"]
+__all__ = ["get_jwks_client", "prefetch_jwks", "reset_jwks_client"]
@@ -8,7 +8,8 @@ from pydantic import BaseModel, ConfigDict, Field, StrictStr, field_validator
 class UserClaims(BaseModel):
     """Normalized representation of the authenticated user."""
 
-    model_config = ConfigDict(extra="allow")
+    # Frozen: instances are shared between requests through the token cache in deps.
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     sub: StrictStr = Field(..., min_length=1)
     roles: list[StrictStr] = Field(default_factory=list)
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 
 from app.shared.types import JSONValue
 
 from .settings import RoleSettings, get_role_settings
-from .utils import extract_str_values, strip_prefix
+from .utils import extract_str_values
 
 # Keys handled explicitly below — skip them during the generic nested scan
 # to avoid adding the same roles twice.
@@ -46,62 +46,67 @@ def parse_hierarchy(raw: str) -> dict[str, frozenset[str]]:
     return result
 
 
-def get_effective_roles(user_roles: list[str], cfg: RoleSettings) -> set[str]:
+def get_effective_roles(user_roles: Iterable[str], cfg: RoleSettings) -> frozenset[str]:
     """Return the *effective* role set for a user after hierarchy expansion.
 
-    If ``ROLE_HIERARCHY`` is not configured, the original role list is returned
-    unchanged. Otherwise every role the user holds is expanded to include all
-    roles it inherits according to the hierarchy.
+    If ``ROLE_HIERARCHY`` is not configured, the original roles are returned
+    unchanged (a ``frozenset`` input is passed through without copying).
+    Otherwise every role the user holds is expanded to include all roles it
+    inherits according to the hierarchy.
 
     ``UserClaims.roles`` is never mutated — expansion only happens during the
     RBAC check so the JWT-sourced roles remain auditable.
     """
     if not cfg.HIERARCHY:
-        return set(user_roles)
+        return frozenset(user_roles)
     hierarchy = parse_hierarchy(cfg.HIERARCHY)
     effective: set[str] = set()
     for role in user_roles:
         effective.add(role)
         effective.update(hierarchy.get(role, frozenset()))
-    return effective
+    return frozenset(effective)
 
 
 def extract_roles(payload: Mapping[str, JSONValue]) -> list[str]:
     """Extract and normalize roles from a decoded JWT payload."""
-    role_settings = get_role_settings()
-    prefix = (role_settings.PREFIX or "").strip()
+    normalize = get_role_settings().normalize_role
 
-    roles: list[str] = []
+    # Normalize and de-duplicate while collecting, so no intermediate list of
+    # raw roles is built.
+    seen: set[str] = set()
+    result: list[str] = []
+
+    add_seen = seen.add
+    append = result.append
+
+    def collect(value: object) -> None:
+        for role in extract_str_values(value):
+            normalized = normalize(role)
+            if normalized and normalized not in seen:
+                add_seen(normalized)
+                append(normalized)
 
     # Top-level role arrays (Keycloak: `roles`, LDAP groups: `groups`)
-    for key in ("roles", "groups"):
-        roles.extend(extract_str_values(payload.get(key)))
+    collect(payload.get("roles"))
+    collect(payload.get("groups"))
 
     # Keycloak realm-level roles
     realm_access = payload.get("realm_access")
     if isinstance(realm_access, Mapping):
-        roles.extend(extract_str_values(realm_access.get("roles")))
+        collect(realm_access.get("roles"))
 
     # Keycloak client-level roles (resource_access.<client>.roles)
     resource_access = payload.get("resource_access")
     if isinstance(resource_access, Mapping):
         for client in resource_access.values():
             if isinstance(client, Mapping):
-                roles.extend(extract_str_values(client.get("roles")))
+                collect(client.get("roles"))
 
     # Generic scan for any other top-level dict that carries a `roles` key,
     # skipping the keys already processed above to prevent double-counting.
     for key, value in payload.items():
         if key not in _KNOWN_NESTED_KEYS and isinstance(value, Mapping) and "roles" in value:
-            roles.extend(extract_str_values(value["roles"]))
-
-    seen: set[str] = set()
-    result: list[str] = []
-    for role in roles:
-        normalized = strip_prefix(role, prefix).strip().lower()
-        if normalized and normalized not in seen:
-            seen.add(normalized)
-            result.append(normalized)
+            collect(value["roles"])
     return result
 
 
@@ -114,15 +119,14 @@ def extract_groups(payload: Mapping[str, JSONValue]) -> list[str]:
     The returned list is used to populate :attr:`UserClaims.groups` and
     drives the Linux-style ACL group-membership check in :mod:`acl`.
     """
-    role_settings = get_role_settings()
-    prefix = (role_settings.PREFIX or "").strip()
+    normalize = get_role_settings().normalize_role
 
     groups_raw = extract_str_values(payload.get("groups"))
 
     seen: set[str] = set()
     result: list[str] = []
     for group in groups_raw:
-        normalized = strip_prefix(group, prefix).strip().lower()
+        normalized = normalize(group)
         if normalized and normalized not in seen:
             seen.add(normalized)
             result.append(normalized)
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
-from functools import lru_cache
+import sys
+from collections.abc import Callable
+from functools import cached_property, lru_cache
 from typing import TypedDict
 
 import jwt
@@ -53,7 +54,7 @@ class _JwtKwargs(TypedDict, total=False):
     audience: str
 
 
-def _try_jwt_decode(fn: Callable[[], Mapping[str, JSONValue]]) -> dict[str, JSONValue]:
+def _try_jwt_decode(fn: Callable[[], dict[str, JSONValue]]) -> dict[str, JSONValue]:
     """Run *fn* and map all PyJWT exceptions to HTTP 401."""
     try:
         raw = fn()
@@ -75,7 +76,26 @@ def _try_jwt_decode(fn: Callable[[], Mapping[str, JSONValue]]) -> dict[str, JSON
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="token_format_invalid") from exc
     except jwt.InvalidTokenError as exc:
         raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="invalid_token") from exc
-    return dict(raw)
+    return raw
+
+
+@lru_cache(maxsize=2048)
+def _parse_header_segment(segment: str) -> JWTHeader:
+    """Parse the base64 header segment of a JWT.
+
+    Tokens from one issuer share a handful of distinct headers (alg/kid/typ),
+    so caching by segment skips the base64 + JSON work for nearly every token.
+    Callers must copy the result before modifying it.
+    """
+    # get_unverified_header only decodes the first segment; the empty payload
+    # and signature segments just give it the token shape it expects.
+    raw = jwt.get_unverified_header(f"{segment}..")
+    return {
+        # Interned so the handful of distinct algorithm names share one object.
+        "alg": sys.intern(str(raw.get("alg", ""))),
+        "kid": str(raw.get("kid", "")),
+        "typ": str(raw.get("typ", "JWT")),
+    }
 
 
 class JWTAuthService:
@@ -91,19 +111,7 @@ class JWTAuthService:
         return self._decode_without_validation(token)
 
     def _decode_without_validation(self, token: str) -> DecodedToken:
-        try:
-            unverified = jwt.get_unverified_header(token)
-        except jwt.InvalidTokenError as exc:
-            raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="invalid_header") from exc
-
-        if str(unverified.get("alg", "")).upper() == "NONE":
-            raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="alg_none_forbidden")
-
-        header: JWTHeader = {
-            "alg": str(unverified.get("alg", "")),
-            "kid": str(unverified.get("kid", "")),
-            "typ": str(unverified.get("typ", "JWT")),
-        }
+        header = self._validated_header(token)
         try:
             raw_payload = jwt.decode(
                 token,
@@ -119,42 +127,48 @@ class JWTAuthService:
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="token_format_invalid") from exc
         except (ValueError, KeyError) as exc:
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="token_payload_invalid") from exc
-        return DecodedToken(header=header, payload={str(k): v for k, v in raw_payload.items()})
+        # JSON object keys are always strings, so PyJWT's dict is used as-is.
+        return DecodedToken(header=header, payload=raw_payload)
 
     def _decode_with_validation(self, token: str) -> DecodedToken:
         header = self._validated_header(token)
-        kwargs = self._build_decode_kwargs()
-        mode = self._settings.MODE.lower()
-        if mode == "jwks":
-            payload = self._decode_with_jwks(token, kwargs)
-        elif mode == "hs":
-            payload = self._decode_with_hmac(token, kwargs)
-        else:
+        decode = _MODE_DECODERS.get(self._settings.MODE)
+        if decode is None:
             raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail="auth_mode_invalid")
-        return DecodedToken(header=header, payload=payload)
+        return DecodedToken(header=header, payload=decode(self, token, header, self._decode_kwargs))
 
     def _validated_header(self, token: str) -> JWTHeader:
+        segment, sep, rest = token.partition(".")
         try:
-            raw = jwt.get_unverified_header(token)
+            if not sep or "." not in rest:
+                raise jwt.DecodeError("Not enough segments")
+            header = _parse_header_segment(segment).copy()
         except jwt.InvalidTokenError as exc:
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="invalid_header") from exc
-        header: JWTHeader = {
-            "alg": str(raw.get("alg", "")),
-            "kid": str(raw.get("kid", "")),
-            "typ": str(raw.get("typ", "JWT")),
-        }
-        if header.get("alg", "").upper() == "NONE":
+        if header.get("alg", "").lower() == "none":
             raise HTTPException(status.HTTP_401_UNAUTHORIZED, detail="alg_none_forbidden")
         return header
 
+    @cached_property
+    def _decode_kwargs(self) -> _JwtKwargs:
+        """Decode kwargs for this service's settings, built on first use and reused per token."""
+        return self._build_decode_kwargs()
+
+    @cached_property
+    def _hs_secret(self) -> bytes | None:
+        """``HS_SECRET`` encoded once as the HMAC key, or ``None`` when unset or empty."""
+        if not self._settings.HS_SECRET:
+            return None
+        return self._settings.HS_SECRET.get_secret_value().encode() or None
+
     def _build_decode_kwargs(self) -> _JwtKwargs:
         s = self._settings
         algorithms = [alg.upper() for alg in s.ALGORITHMS] or ["RS256"]
-        if s.MODE.lower() == "jwks":
+        if s.MODE == "jwks":
             # Strip all HMAC algorithms when using JWKS to prevent algorithm-confusion attacks.
             # An attacker could otherwise forge a token signed with HS256 using the RSA public key as secret.
             algorithms = [alg for alg in algorithms if alg not in _HMAC_ALGORITHMS] or ["RS256"]
-        elif s.MODE.lower() == "hs" and not any(alg in _HMAC_ALGORITHMS for alg in algorithms):
+        elif s.MODE == "hs" and not any(alg in _HMAC_ALGORITHMS for alg in algorithms):
             algorithms.append("HS256")
         options: _JwtOptions = {
             "verify_signature": s.VERIFY_SIGNATURE,
@@ -175,20 +189,28 @@ class JWTAuthService:
             kwargs["audience"] = s.AUDIENCE
         return kwargs
 
-    def _decode_with_jwks(self, token: str, kwargs: _JwtKwargs) -> dict[str, JSONValue]:
+    def _decode_with_jwks(self, token: str, header: JWTHeader, kwargs: _JwtKwargs) -> dict[str, JSONValue]:
         try:
-            signing_key = get_jwks_client().get_signing_key_from_jwt(token)
+            # The header is already parsed; get_signing_key_from_jwt would decode the whole token again.
+            signing_key = get_jwks_client().get_signing_key(header.get("kid", ""))
         except (jwt.PyJWKClientConnectionError, jwt.PyJWKSetError, RuntimeError) as exc:
             raise HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, detail="jwks_unavailable") from exc
+        # PyJWK.key is an already-loaded cryptography key object, so jwt.decode does no key parsing.
         return _try_jwt_decode(lambda: jwt.decode(token, signing_key.key, **kwargs))
 
-    def _decode_with_hmac(self, token: str, kwargs: _JwtKwargs) -> dict[str, JSONValue]:
-        if not self._settings.HS_SECRET:
+    def _decode_with_hmac(self, token: str, header: JWTHeader, kwargs: _JwtKwargs) -> dict[str, JSONValue]:
+        secret = self._hs_secret
+        if secret is None:
             raise HTTPException(status.HTTP_500_INTERNAL_SERVER_ERROR, detail="auth_hs_secret_missing")
-        secret = self._settings.HS_SECRET.get_secret_value()
         return _try_jwt_decode(lambda: jwt.decode(token, secret, **kwargs))
 
 
+_MODE_DECODERS: dict[str, Callable[[JWTAuthService, str, JWTHeader, _JwtKwargs], dict[str, JSONValue]]] = {
+    "jwks": JWTAuthService._decode_with_jwks,
+    "hs": JWTAuthService._decode_with_hmac,
+}
+
+
 # Use an lru_cache as a lazy singleton factory to avoid module-level globals
 @lru_cache(maxsize=1)
 def get_jwt_service() -> JWTAuthService:
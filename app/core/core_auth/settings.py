@@ -3,17 +3,20 @@ from __future__ import annotations
 """Authentication and role settings with lazy caching."""
 
 import os
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from functools import lru_cache
+from typing import Self
 
 from pydantic import (
     Field,
     HttpUrl,
+    PrivateAttr,
     SecretStr,
     StrictInt,
     StrictStr,
     ValidationInfo,
     field_validator,
+    model_validator,
 )
 from pydantic_core import PydanticUndefined
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -26,19 +29,16 @@ def _split_env_values(raw: str) -> list[str]:
 
 
 def _resolve_env_files(*var_names: str, default: tuple[str, ...]) -> tuple[str, ...]:
-    """Return env file paths based on the first non-empty variable."""
-    files: list[str] = []
+    """Return env file paths collected from *var_names* (deduplicated, in order).
+
+    Evaluated once per settings class, when its ``model_config`` is built at import.
+    """
+    files: dict[str, None] = {}
     for name in var_names:
         raw = os.getenv(name)
         if raw:
-            files.extend(_split_env_values(raw))
-    if not files:
-        return default
-    seen: list[str] = []
-    for path in files:
-        if path not in seen:
-            seen.append(path)
-    return tuple(seen)
+            files.update(dict.fromkeys(_split_env_values(raw)))
+    return tuple(files) or default
 
 
 class AuthSettings(BaseSettings):
@@ -65,6 +65,14 @@ class AuthSettings(BaseSettings):
     VERIFY_AUD: bool = True
     DISABLE_SSL_VERIFY: bool = False
     CLOCK_SKEW_SECS: StrictInt = Field(default=60, ge=0, le=900)
+    TOKEN_CACHE_TTL: int = Field(default=30, ge=0, description="Seconds a validated token is reused; 0 disables")
+    TOKEN_CACHE_MAX_ENTRIES: int = Field(default=4096, ge=1)
+
+    @field_validator("MODE")
+    @classmethod
+    def _lowercase_mode(cls, value: str) -> str:
+        """Store ``MODE`` lowercased so callers can dispatch on it directly."""
+        return value.lower()
 
     @field_validator("CLOCK_SKEW_SECS", mode="before")
     @classmethod
@@ -92,6 +100,7 @@ class AuthSettings(BaseSettings):
     ALGORITHMS: list[StrictStr] | StrictStr = Field(default_factory=lambda: ["RS256"])
 
     JWKS_URL: HttpUrl | None = None
+    JWKS_MIN_TTL: int = Field(default=300, ge=1, description="Seconds the fetched JWK set is reused")
     HS_SECRET: SecretStr | None = None
 
     @field_validator("ALGORITHMS", mode="before")
@@ -131,6 +140,22 @@ def _legacy_env_value(*names: str) -> str | None:
     return None
 
 
+def _role_normalizer(prefix: str | None) -> Callable[[str], str]:
+    prefix = (prefix or "").strip()
+    if not prefix:
+        return lambda role: role.strip().lower()
+    prefix_len = len(prefix)
+    prefix_lower = prefix.lower()
+
+    def normalize(role: str) -> str:
+        # One slice comparison covers both the exact and the case-insensitive match.
+        if role[:prefix_len].lower() == prefix_lower:
+            role = role[prefix_len:]
+        return role.strip().lower()
+
+    return normalize
+
+
 _LEGACY_ROLE_ENV_MAP: dict[str, tuple[str, ...]] = {
     "READ_ROLES": ("ROLES_READ",),
     "WRITE_ROLES": ("ROLES_WRITE",),
@@ -153,6 +178,8 @@ class RoleSettings(BaseSettings):
         env_prefix="ROLE_",
         extra="ignore",
         case_sensitive=False,
+        # Frozen: the derived helpers below are computed once at validation time.
+        frozen=True,
     )
 
     ACTIVE: bool = True
@@ -171,6 +198,34 @@ class RoleSettings(BaseSettings):
         ),
     )
 
+    _normalize_role: Callable[[str], str] = PrivateAttr(default_factory=lambda: _role_normalizer(None))
+    _write_or_admin_roles: tuple[str, ...] = PrivateAttr(default=())
+    _delete_or_admin_roles: tuple[str, ...] = PrivateAttr(default=())
+    _any_roles: tuple[str, ...] = PrivateAttr(default=())
+
+    @property
+    def write_or_admin_roles(self) -> tuple[str, ...]:
+        """Roles that grant write access (``WRITE_ROLES`` followed by ``ADMIN_ROLES``)."""
+        return self._write_or_admin_roles
+
+    @property
+    def delete_or_admin_roles(self) -> tuple[str, ...]:
+        """Roles that grant delete access (``DELETE_ROLES`` followed by ``ADMIN_ROLES``)."""
+        return self._delete_or_admin_roles
+
+    @property
+    def any_roles(self) -> tuple[str, ...]:
+        """Every configured read, write, delete and admin role."""
+        return self._any_roles
+
+    @property
+    def normalize_role(self) -> Callable[[str], str]:
+        """Role normalizer (prefix strip, trim, lowercase) specialized for ``PREFIX``.
+
+        Matches ``strip_prefix(role, PREFIX).strip().lower()``.
+        """
+        return self._normalize_role
+
     @field_validator("ACTIVE", mode="before")
     @classmethod
     def _fallback_active(cls, value: object) -> object:
@@ -206,6 +261,14 @@ class RoleSettings(BaseSettings):
             return [str(entry).strip().lower() for entry in value if str(entry).strip()]
         raise TypeError("Roles must be provided as string or iterable")
 
+    @model_validator(mode="after")
+    def _build_role_helpers(self) -> Self:
+        self._normalize_role = _role_normalizer(self.PREFIX)
+        self._write_or_admin_roles = (*self.WRITE_ROLES, *self.ADMIN_ROLES)
+        self._delete_or_admin_roles = (*self.DELETE_ROLES, *self.ADMIN_ROLES)
+        self._any_roles = (*self.READ_ROLES, *self.WRITE_ROLES, *self.DELETE_ROLES, *self.ADMIN_ROLES)
+        return self
+
 
 @lru_cache(maxsize=1)
 def _cached_auth_settings() -> AuthSettings:
@@ -228,14 +291,20 @@ def get_role_settings() -> RoleSettings:
 
 
 def reload_auth_settings() -> AuthSettings:
-    """Reload AuthSettings (handy for tests)."""
+    """Reload AuthSettings and drop users cached under the old settings (handy for tests)."""
+    from .deps import reset_user_cache
+
     _cached_auth_settings.cache_clear()
+    reset_user_cache()
     return _cached_auth_settings()
 
 
 def reload_role_settings() -> RoleSettings:
-    """Reload RoleSettings (handy for tests)."""
+    """Reload RoleSettings and drop users cached under the old settings (handy for tests)."""
+    from .deps import reset_user_cache
+
     _cached_role_settings.cache_clear()
+    reset_user_cache()
     return _cached_role_settings()
 
 
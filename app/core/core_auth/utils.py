@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import cast
 
 
@@ -12,25 +12,37 @@ def extract_str_values(value: object) -> list[str]:
         stripped = value.strip()
         return [stripped] if stripped else []
     if isinstance(value, Iterable):
-        return [
-            stripped
-            for item in cast(Iterable[object], value)
-            if not isinstance(item, list | dict) and (stripped := str(item).strip())
-        ]
+        values: list[str] = []
+        append = values.append
+        for item in cast(Iterable[object], value):
+            if isinstance(item, str):
+                stripped = item.strip()
+            elif isinstance(item, (list, dict)):
+                continue
+            else:
+                stripped = str(item).strip()
+            if stripped:
+                append(stripped)
+        return values
     return []
 
 
 def strip_prefix(text: str, prefix: str) -> str:
-    """Remove *prefix* from *text*, case-sensitively first, then case-insensitively."""
+    """Remove *prefix* from *text* if it starts with it (case-insensitive)."""
     if not prefix:
         return text
-    if text.startswith(prefix):
-        return text[len(prefix) :]
-    if text.lower().startswith(prefix.lower()):
-        return text[len(prefix) :]
+    prefix_len = len(prefix)
+    if text[:prefix_len].lower() == prefix.lower():
+        return text[prefix_len:]
     return text
 
 
+def token_expiry(payload: Mapping[str, object]) -> float | None:
+    """Return the numeric ``exp`` claim of *payload*, or ``None`` when absent or malformed."""
+    exp = payload.get("exp")
+    return float(exp) if isinstance(exp, int | float) and not isinstance(exp, bool) else None
+
+
 def has_any(user_roles: Iterable[str], required: Iterable[str]) -> bool:
     """Return ``True`` if *user_roles* and *required* share at least one role."""
     normalised_user = {r.strip().lower() for r in user_roles if r.strip()}
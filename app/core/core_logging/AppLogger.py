@@ -7,13 +7,21 @@ import pathlib
 from logging import getLogger
 
 from app.config import get_app_settings
-from app.core.core_logging.LogTypeAdapter import LogTypeAdapter
+from app.core.core_logging.LogTypeFilter import LogTypeFilter
 
 fastapi_logger = logging.getLogger("app_logger")
 
-system_logger = LogTypeAdapter(getLogger("system"), {"log_type": "SYSTEM"})
-single_logger = LogTypeAdapter(getLogger("single"), {"log_type": "SINGLE"})
-journey_logger = LogTypeAdapter(getLogger("journey"), {"log_type": "JOURNEY"})
+
+def _typed_logger(name: str, log_type: str) -> logging.Logger:
+    logger = getLogger(name)
+    if not any(isinstance(existing, LogTypeFilter) for existing in logger.filters):
+        logger.addFilter(LogTypeFilter(log_type))
+    return logger
+
+
+system_logger = _typed_logger("system", "SYSTEM")
+single_logger = _typed_logger("single", "SINGLE")
+journey_logger = _typed_logger("journey", "JOURNEY")
 
 
 def setup_logging() -> None:
@@ -0,0 +1,42 @@
+import logging
+from collections.abc import Iterator
+
+import pytest
+from app.core.core_logging.AppLogger import journey_logger
+from app.core.core_logging.JourneyLogger import JourneyTracker
+
+
+@pytest.fixture
+def journey_caplog(caplog: pytest.LogCaptureFixture) -> Iterator[pytest.LogCaptureFixture]:
+    # The journey logger does not propagate to root, so hook caplog in directly.
+    caplog.set_level(logging.INFO, logger=journey_logger.name)
+    journey_logger.addHandler(caplog.handler)
+    try:
+        yield caplog
+    finally:
+        journey_logger.removeHandler(caplog.handler)
+
+
+def test_journey_tracker_logs_through_journey_logger(journey_caplog: pytest.LogCaptureFixture) -> None:
+    tracker = JourneyTracker("req")
+    tracker.add_step("start", {"foo": "bar"})
+    tracker.set_failure()
+
+    tracker.log_journey()
+
+    record = journey_caplog.records[-1]
+    extras = record.__dict__
+    assert record.name == "journey"
+    assert record.getMessage() == "Journey log"
+    assert extras["request_id"] == "req"
+    assert extras["log_type"] == "JOURNEY"
+    assert extras["success"] is False
+    assert [(step["step"], step["data"]) for step in extras["steps"]] == [("start", {"foo": "bar"})]
+
+
+def test_add_step_accepts_legacy_keyword() -> None:
+    tracker = JourneyTracker("req")
+
+    tracker.add_step(descrption="legacy")
+
+    assert tracker.steps[0]["step"] == "legacy"
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import logging
+
+
+class LogTypeFilter(logging.Filter):
+    """Stamp every record of the logger it is attached to with a fixed log type."""
+
+    def __init__(self, log_type: str) -> None:
+        super().__init__()
+        self.log_type = log_type
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Set on the record directly; no per-call extra dict like a LoggerAdapter needs.
+        record.log_type = self.log_type
+        return True
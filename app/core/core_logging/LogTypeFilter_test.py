@@ -0,0 +1,31 @@
+import logging
+
+import pytest
+from app.core.core_logging.LogTypeFilter import LogTypeFilter
+
+
+def test_log_type_filter_stamps_record_and_keeps_extras(caplog: pytest.LogCaptureFixture) -> None:
+    logger = logging.getLogger("tests.log_type_filter")
+    log_filter = LogTypeFilter("SYSTEM")
+    logger.addFilter(log_filter)
+    caplog.set_level(logging.INFO, logger=logger.name)
+
+    try:
+        logger.info("hello", extra={"request_id": "req-1", "foo": "bar"})
+    finally:
+        logger.removeFilter(log_filter)
+
+    (record,) = caplog.records
+    assert {key: record.__dict__[key] for key in ("log_type", "request_id", "foo")} == {
+        "log_type": "SYSTEM",
+        "request_id": "req-1",
+        "foo": "bar",
+    }
+
+
+def test_log_type_filter_overrides_caller_log_type() -> None:
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, "msg", None, None)
+    record.log_type = "SINGLE"
+
+    assert LogTypeFilter("JOURNEY").filter(record) is True
+    assert record.__dict__["log_type"] == "JOURNEY"
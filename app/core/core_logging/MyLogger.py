@@ -3,32 +3,71 @@ from __future__ import annotations
 import datetime as dt
 import json
 import logging
+import math
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-LOG_RECORD_BUILTIN_ATTRS = {
-    "name",
-    "msg",
-    "args",
-    "levelname",
-    "levelno",
-    "pathname",
-    "filename",
-    "module",
-    "exc_info",
-    "exc_text",
-    "stack_info",
-    "lineno",
-    "funcName",
-    "created",
-    "msecs",
-    "relativeCreated",
-    "thread",
-    "threadName",
-    "processName",
-    "process",
-    "message",
-}
+LOG_RECORD_BUILTIN_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "message",
+    }
+)
+
+
+try:
+    _BERLIN_TZ: dt.tzinfo = ZoneInfo("Europe/Berlin")
+except ZoneInfoNotFoundError:
+    # Fallback to UTC if system tzdata is not available (common on some minimal Windows installs)
+    _BERLIN_TZ = dt.UTC
+
+# One-slot cell holding (epoch second, "YYYY-MM-DDTHH:MM:SS", "+HH:MM") of the last
+# formatted timestamp; the tuple is swapped whole so readers never see a mix.
+_timestamp_cache: list[tuple[int, str, str]] = [(-1, "", "")]
+
 
+def _format_timestamp(created: float) -> str:
+    """Format *created* like datetime.fromtimestamp(created, _BERLIN_TZ).isoformat().
+
+    Records logged within the same second share the date/time and offset parts,
+    so only the microseconds are formatted per record.
+    """
+    frac, whole = math.modf(created)
+    second = int(whole)
+    micros = round(frac * 1_000_000)
+    if micros >= 1_000_000:
+        second += 1
+        micros -= 1_000_000
+    cached_second, prefix, offset = _timestamp_cache[0]
+    if cached_second != second:
+        iso = dt.datetime.fromtimestamp(second, tz=_BERLIN_TZ).isoformat()
+        prefix, offset = iso[:19], iso[19:]
+        _timestamp_cache[0] = (second, prefix, offset)
+    if micros:
+        return f"{prefix}.{micros:06d}{offset}"
+    return prefix + offset
+
+
+# json.dumps(..., default=str) builds a new JSONEncoder on every call; reuse one.
+_JSON_ENCODER = json.JSONEncoder(default=str)
 
 _ANSI_RED = "\033[31m"
 _ANSI_YELLOW = "\033[33m"
@@ -48,26 +87,20 @@ class MyJSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         message = self._prepare_log_dict(record)
-        line = json.dumps(message, default=str)
+        line = _JSON_ENCODER.encode(message)
         color = _LEVEL_COLORS.get(record.levelno)
         if color:
             return f"{color}{line}{_ANSI_RESET}"
         return line
 
     def _prepare_log_dict(self, record: logging.LogRecord) -> dict[str, object]:
-        try:
-            berlin_tz = ZoneInfo("Europe/Berlin")
-        except ZoneInfoNotFoundError:
-            # Fallback to UTC if system tzdata is not available (common on some minimal Windows installs)
-            berlin_tz = dt.UTC
-
         # These fields will always be included in the JSON log output, regardless of the configuration in stdout_config.json.
         # The goal is to define a minimal, consistent log structure here.
         # For specialized logging needs, you can create and configure custom loggers and  extend them with additional keywords
         always_fields = {
             "level": record.levelname,
             "message": record.getMessage(),
-            "timestamp": dt.datetime.fromtimestamp(record.created, tz=berlin_tz).isoformat(),
+            "timestamp": _format_timestamp(record.created),
             "log_type": getattr(record, "log_type", "SINGLE"),
         }
         if record.exc_info is not None:
@@ -76,14 +109,16 @@ class MyJSONFormatter(logging.Formatter):
         if record.stack_info is not None:
             always_fields["stack_info"] = self.formatStack(record.stack_info)
 
-        message = {
-            key: (msg_val if (msg_val := always_fields.pop(val, None)) is not None else getattr(record, val))
-            for key, val in self.fmt_keys.items()
-        }
+        message: dict[str, object] = {}
+        pop_always = always_fields.pop
+        for key, val in self.fmt_keys.items():
+            msg_val = pop_always(val, None)
+            message[key] = msg_val if msg_val is not None else getattr(record, val)
         message.update(always_fields)
 
+        builtin_attrs = LOG_RECORD_BUILTIN_ATTRS
         for key, val in record.__dict__.items():
-            if key not in LOG_RECORD_BUILTIN_ATTRS:
+            if key not in builtin_attrs:
                 message[key] = val
 
         return message
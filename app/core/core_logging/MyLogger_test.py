@@ -0,0 +1,59 @@
+import datetime as dt
+import json
+import logging
+from collections.abc import Callable
+
+import pytest
+from app.core.core_logging.MyLogger import _BERLIN_TZ, MyJSONFormatter
+
+RecordFactory = Callable[..., logging.LogRecord]
+
+
+@pytest.fixture(scope="module")
+def json_formatter() -> MyJSONFormatter:
+    return MyJSONFormatter(fmt_keys={"level": "levelname", "message": "message", "logger": "name"})
+
+
+@pytest.fixture
+def make_record() -> RecordFactory:
+    def _make(msg: str = "hello %s", args: tuple[object, ...] = ("world",), **extra: object) -> logging.LogRecord:
+        record = logging.LogRecord("test.logger", logging.INFO, __file__, 10, msg, args, None)
+        record.__dict__.update(extra)
+        return record
+
+    return _make
+
+
+def test_formats_configured_and_always_fields(json_formatter: MyJSONFormatter, make_record: RecordFactory) -> None:
+    payload = json.loads(json_formatter.format(make_record(request_id="abc")))
+
+    assert list(payload)[:3] == ["level", "message", "logger"]
+    assert payload["level"] == "INFO"
+    assert payload["message"] == "hello world"
+    assert payload["logger"] == "test.logger"
+    assert payload["log_type"] == "SINGLE"
+    assert payload["request_id"] == "abc"
+
+
+@pytest.mark.parametrize("log_type", ["SYSTEM", "SINGLE", "JOURNEY"])
+def test_keeps_record_log_type(json_formatter: MyJSONFormatter, make_record: RecordFactory, log_type: str) -> None:
+    payload = json.loads(json_formatter.format(make_record(log_type=log_type)))
+
+    assert payload["log_type"] == log_type
+
+
+@pytest.mark.parametrize("created", [1743296399.5, 1743296400.0, 1761440399.999999, 1761440400.25])
+def test_timestamp_matches_isoformat(
+    json_formatter: MyJSONFormatter, make_record: RecordFactory, created: float
+) -> None:
+    record = make_record(created=created)
+
+    payload = json.loads(json_formatter.format(record))
+
+    assert payload["timestamp"] == dt.datetime.fromtimestamp(created, tz=_BERLIN_TZ).isoformat()
+
+
+def test_non_json_extras_fall_back_to_str(json_formatter: MyJSONFormatter, make_record: RecordFactory) -> None:
+    payload = json.loads(json_formatter.format(make_record(day=dt.date(2024, 1, 2))))
+
+    assert payload["day"] == "2024-01-02"
@@ -2,21 +2,22 @@ from __future__ import annotations
 
 import logging
 import time
-import uuid
 from asyncio import Lock
 from collections import defaultdict
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
+from secrets import token_hex
 
 from app.core.core_messages import MessageKeys, msg
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("app_logger")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SecurityHeadersConfig:
     enabled: bool
     hsts_enabled: bool
@@ -42,7 +43,9 @@ def register_http_logging_middleware(
         request: Request, call_next: Callable[[Request], Awaitable[Response]]
     ) -> Response:
         started = time.time()
-        if request_logging_enabled:
+        # Skip building log arguments (URL path, client host) when INFO is filtered out.
+        log_info = logger.isEnabledFor(logging.INFO)
+        if request_logging_enabled and log_info:
             logger.info(
                 "HTTP request %s %s from %s",
                 request.method,
@@ -57,7 +60,7 @@ def register_http_logging_middleware(
                 logger.exception("HTTP failure %s %s", request.method, request.url.path)
             raise
 
-        if response_logging_enabled:
+        if response_logging_enabled and log_info:
             duration_ms = int((time.time() - started) * 1000)
             logger.info(
                 "HTTP response %s %s -> %s in %sms",
@@ -113,6 +116,97 @@ def register_request_size_middleware(app: FastAPI, *, max_request_size_bytes: in
         return await call_next(request)
 
 
+_REQUEST_ID_HEADER = b"x-request-id"
+
+
+def _security_header_pairs(config: SecurityHeadersConfig | None) -> tuple[tuple[bytes, bytes], ...]:
+    """Return the configured security headers as raw ASGI ``(name, value)`` pairs."""
+    if config is None or not config.enabled:
+        return ()
+
+    headers: list[tuple[str, str]] = [("X-Content-Type-Options", "nosniff")]
+    if config.x_frame_options:
+        headers.append(("X-Frame-Options", config.x_frame_options))
+    headers.append(("Referrer-Policy", "strict-origin-when-cross-origin"))
+    if config.hsts_enabled:
+        headers.append(("Strict-Transport-Security", f"max-age={config.hsts_max_age}; includeSubDomains"))
+    if config.csp_enabled and config.csp_directives:
+        headers.append(("Content-Security-Policy", config.csp_directives))
+    return tuple((name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers)
+
+
+def _incoming_request_id(scope: Scope) -> bytes | None:
+    # ASGI servers lower-case request header names.
+    for name, value in scope["headers"]:
+        if name == _REQUEST_ID_HEADER:
+            return value or None
+    return None
+
+
+def _rewrite_response_headers(
+    raw_headers: Iterable[tuple[bytes, bytes]],
+    *,
+    request_id: bytes | None,
+    security_headers: tuple[tuple[bytes, bytes], ...],
+) -> list[tuple[bytes, bytes]]:
+    """Add missing security headers and set the single ``x-request-id`` response header."""
+    headers = list(raw_headers)
+    if request_id is not None:
+        headers = [(name, value) for name, value in headers if name.lower() != _REQUEST_ID_HEADER]
+    if security_headers:
+        present = {name.lower() for name, _ in headers}
+        headers.extend(pair for pair in security_headers if pair[0] not in present)
+    if request_id is not None:
+        headers.append((_REQUEST_ID_HEADER, request_id))
+    return headers
+
+
+class RequestLifecycleMiddleware:
+    """Pure ASGI middleware that assigns the request id and adds security headers.
+
+    Both jobs only touch the request scope and the response start message, so
+    they share one ``send`` wrapper instead of two ``@app.middleware("http")``
+    layers, each of which goes through BaseHTTPMiddleware's task and stream plumbing.
+    Header names and values are encoded once at construction.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        request_id: bool = True,
+        security_headers: SecurityHeadersConfig | None = None,
+    ) -> None:
+        self.app = app
+        self._request_id = request_id
+        self._security_headers = _security_header_pairs(security_headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id: bytes | None = None
+        if self._request_id:
+            request_id = _incoming_request_id(scope) or token_hex(16).encode("latin-1")
+            scope.setdefault("state", {})["request_id"] = request_id.decode("latin-1")
+        security_headers = self._security_headers
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = _rewrite_response_headers(
+                    message.get("headers", ()), request_id=request_id, security_headers=security_headers
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def register_request_lifecycle_middleware(app: FastAPI, security_headers: SecurityHeadersConfig) -> None:
+    """Register request-id handling and security headers as a single middleware."""
+    app.add_middleware(RequestLifecycleMiddleware, request_id=True, security_headers=security_headers)
+
+
 def register_security_headers_middleware(
     app: FastAPI,
     config: SecurityHeadersConfig,
@@ -120,33 +214,11 @@ def register_security_headers_middleware(
     if not config.enabled:
         return
 
-    @app.middleware("http")
-    async def security_headers_middleware(
-        request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
-        response = await call_next(request)
-        response.headers.setdefault("X-Content-Type-Options", "nosniff")
-        if config.x_frame_options:
-            response.headers.setdefault("X-Frame-Options", config.x_frame_options)
-        response.headers.setdefault("Referrer-Policy", "strict-origin-when-cross-origin")
-        if config.hsts_enabled:
-            response.headers.setdefault(
-                "Strict-Transport-Security",
-                f"max-age={config.hsts_max_age}; includeSubDomains",
-            )
-        if config.csp_enabled and config.csp_directives:
-            response.headers.setdefault("Content-Security-Policy", config.csp_directives)
-        return response
+    app.add_middleware(RequestLifecycleMiddleware, request_id=False, security_headers=config)
 
 
 def register_request_id_middleware(app: FastAPI) -> None:
-    @app.middleware("http")
-    async def request_id_middleware(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
-        request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-        request.state.request_id = request_id
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
+    app.add_middleware(RequestLifecycleMiddleware, request_id=True)
 
 
 def register_rate_limit_middleware(app: FastAPI, *, enabled: bool, max_requests: int, window_seconds: int) -> None:
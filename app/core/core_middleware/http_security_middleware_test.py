@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from starlette.testclient import TestClient
 
 
@@ -71,6 +71,29 @@ class TestHttpLoggingMiddleware:
         response = client.get("/ping")
         assert response.status_code == 200
 
+    def test_request_and_response_logged_only_when_info_enabled(self, caplog):
+        import logging
+
+        from app.core.core_middleware.http_security_middleware import register_http_logging_middleware
+
+        app = _simple_app()
+        register_http_logging_middleware(
+            app,
+            enabled=True,
+            request_logging_enabled=True,
+            response_logging_enabled=True,
+            fault_logging_enabled=True,
+        )
+        client = TestClient(app)
+        with caplog.at_level(logging.WARNING, logger="app_logger"):
+            client.get("/ping")
+        assert not [r for r in caplog.records if r.message.startswith("HTTP ")]
+        with caplog.at_level(logging.INFO, logger="app_logger"):
+            client.get("/ping")
+        messages = [r.message for r in caplog.records if r.message.startswith("HTTP ")]
+        assert any(m.startswith("HTTP request GET /ping") for m in messages)
+        assert any(m.startswith("HTTP response GET /ping -> 200") for m in messages)
+
     def test_exception_is_re_raised_with_fault_logging(self):
         from app.core.core_middleware.http_security_middleware import register_http_logging_middleware
 
@@ -376,6 +399,133 @@ class TestSecurityHeadersMiddleware:
         resp = client.get("/ping")
         assert "Content-Security-Policy" not in resp.headers
 
+    def test_route_headers_are_not_overridden(self):
+        from app.core.core_middleware.http_security_middleware import (
+            SecurityHeadersConfig,
+            register_security_headers_middleware,
+        )
+        from fastapi.responses import JSONResponse
+
+        app = FastAPI()
+
+        @app.get("/embed")
+        async def embed():
+            return JSONResponse({"ok": True}, headers={"X-Frame-Options": "SAMEORIGIN"})
+
+        cfg = SecurityHeadersConfig(
+            enabled=True,
+            hsts_enabled=False,
+            hsts_max_age=0,
+            csp_enabled=False,
+            csp_directives="",
+            x_frame_options="DENY",
+        )
+        register_security_headers_middleware(app, cfg)
+        client = TestClient(app)
+        resp = client.get("/embed")
+        assert resp.headers.get("X-Frame-Options") == "SAMEORIGIN"
+        assert resp.headers.get("X-Content-Type-Options") == "nosniff"
+
+
+# --------------------------------------------------------------------------- #
+# Request-id middleware
+# --------------------------------------------------------------------------- #
+class TestRequestIdMiddleware:
+    def test_generates_hex_request_id(self):
+        from app.core.core_middleware.http_security_middleware import register_request_id_middleware
+
+        app = _simple_app()
+        register_request_id_middleware(app)
+        client = TestClient(app)
+        first = client.get("/ping").headers["X-Request-ID"]
+        second = client.get("/ping").headers["X-Request-ID"]
+        assert len(first) == 32
+        int(first, 16)  # should not raise
+        assert first != second
+
+    def test_keeps_incoming_request_id(self):
+        from app.core.core_middleware.http_security_middleware import register_request_id_middleware
+
+        app = _simple_app()
+        register_request_id_middleware(app)
+        client = TestClient(app)
+        resp = client.get("/ping", headers={"X-Request-ID": "abc-123"})
+        assert resp.headers["X-Request-ID"] == "abc-123"
+
+    def test_request_id_is_exposed_on_request_state(self):
+        from app.core.core_middleware.http_security_middleware import register_request_id_middleware
+
+        app = FastAPI()
+
+        @app.get("/rid")
+        async def rid(request: Request):
+            return {"request_id": request.state.request_id}
+
+        register_request_id_middleware(app)
+        client = TestClient(app)
+        resp = client.get("/rid", headers={"X-Request-ID": "abc-123"})
+        assert resp.json() == {"request_id": "abc-123"}
+
+
+class TestRequestLifecycleMiddleware:
+    def test_adds_request_id_and_security_headers_in_one_layer(self):
+        from app.core.core_middleware.http_security_middleware import (
+            SecurityHeadersConfig,
+            register_request_lifecycle_middleware,
+        )
+
+        app = _simple_app()
+        cfg = SecurityHeadersConfig(
+            enabled=True,
+            hsts_enabled=True,
+            hsts_max_age=60,
+            csp_enabled=False,
+            csp_directives="",
+            x_frame_options="DENY",
+        )
+        register_request_lifecycle_middleware(app, cfg)
+        assert len(app.user_middleware) == 1
+        client = TestClient(app)
+        resp = client.get("/ping", headers={"X-Request-ID": "abc-123"})
+        assert resp.headers["X-Request-ID"] == "abc-123"
+        assert resp.headers["X-Frame-Options"] == "DENY"
+        assert resp.headers["Strict-Transport-Security"] == "max-age=60; includeSubDomains"
+
+    def test_replaces_route_request_id_without_duplicates(self):
+        from app.core.core_middleware.http_security_middleware import register_request_id_middleware
+        from fastapi.responses import JSONResponse
+
+        app = FastAPI()
+
+        @app.get("/rid")
+        async def rid():
+            return JSONResponse({"ok": True}, headers={"X-Request-ID": "from-route"})
+
+        register_request_id_middleware(app)
+        client = TestClient(app)
+        resp = client.get("/rid", headers={"X-Request-ID": "abc-123"})
+        assert resp.headers.get_list("X-Request-ID") == ["abc-123"]
+
+    def test_disabled_security_headers_still_set_request_id(self):
+        from app.core.core_middleware.http_security_middleware import (
+            SecurityHeadersConfig,
+            register_request_lifecycle_middleware,
+        )
+
+        app = _simple_app()
+        cfg = SecurityHeadersConfig(
+            enabled=False,
+            hsts_enabled=True,
+            hsts_max_age=60,
+            csp_enabled=False,
+            csp_directives="",
+        )
+        register_request_lifecycle_middleware(app, cfg)
+        client = TestClient(app)
+        resp = client.get("/ping")
+        assert len(resp.headers["X-Request-ID"]) == 32
+        assert "X-Content-Type-Options" not in resp.headers
+
 
 # --------------------------------------------------------------------------- #
 # Rate-limit middleware
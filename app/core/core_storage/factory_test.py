@@ -1,5 +1,6 @@
 """Tests for storage factory and settings."""
 
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -10,6 +11,20 @@ from app.core.core_storage.filesystem import FilesystemStorageClient
 from app.core.core_storage.settings import StorageBackend, StorageSettings, get_storage_settings
 from pydantic import ValidationError
 
+SetEnv = Callable[[Mapping[str, object]], None]
+
+
+@pytest.fixture
+def set_env(monkeypatch: pytest.MonkeyPatch) -> SetEnv:
+    """Apply a batch of environment variables, undone by monkeypatch at teardown."""
+
+    def _apply(mapping: Mapping[str, object]) -> None:
+        for key, value in mapping.items():
+            monkeypatch.setenv(key, str(value))
+
+    return _apply
+
+
 # --------------------------------------------------------------------------- #
 # StorageSettings
 # --------------------------------------------------------------------------- #
@@ -77,17 +92,22 @@ def test_settings_accepts_cluster_secret_aliases(
 )
 def test_settings_from_env(
     monkeypatch: pytest.MonkeyPatch,
+    set_env: SetEnv,
     tmp_path: Path,
     access_key_var: str,
     secret_key_var: str,
 ) -> None:
     monkeypatch.chdir(tmp_path)
-    monkeypatch.setenv("STORAGE_BACKEND", "s3")
-    monkeypatch.setenv("S3_BUCKET", "my-bucket")
-    monkeypatch.setenv("S3_ENDPOINT", "http://minio:9000")
-    monkeypatch.setenv("S3_REGION", "eu-central-1")
-    monkeypatch.setenv(access_key_var, "key")
-    monkeypatch.setenv(secret_key_var, "secret")
+    set_env(
+        {
+            "STORAGE_BACKEND": "s3",
+            "S3_BUCKET": "my-bucket",
+            "S3_ENDPOINT": "http://minio:9000",
+            "S3_REGION": "eu-central-1",
+            access_key_var: "key",
+            secret_key_var: "secret",
+        }
+    )
 
     settings = StorageSettings()
     assert settings.STORAGE_BACKEND == StorageBackend.S3
@@ -105,9 +125,8 @@ def test_settings_from_env(
 # --------------------------------------------------------------------------- #
 
 
-def test_factory_returns_filesystem(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("STORAGE_BACKEND", "filesystem")
-    monkeypatch.setenv("FILESYSTEM_ROOT", str(tmp_path))
+def test_factory_returns_filesystem(tmp_path: Path, set_env: SetEnv) -> None:
+    set_env({"STORAGE_BACKEND": "filesystem", "FILESYSTEM_ROOT": tmp_path})
 
     # Clear caches so factory picks up new settings
     get_storage_settings.cache_clear()
@@ -134,16 +153,20 @@ def test_factory_returns_filesystem(tmp_path: Path, monkeypatch: pytest.MonkeyPa
     ],
 )
 def test_factory_returns_s3(
-    monkeypatch: pytest.MonkeyPatch,
+    set_env: SetEnv,
     access_key_var: str,
     secret_key_var: str,
 ) -> None:
-    monkeypatch.setenv("STORAGE_BACKEND", "s3")
-    monkeypatch.setenv("S3_BUCKET", "test-bucket")
-    monkeypatch.setenv("S3_ENDPOINT", "http://minio:9000")
-    monkeypatch.setenv(access_key_var, "key")
-    monkeypatch.setenv(secret_key_var, "secret")
-    monkeypatch.setenv("S3_SECURE", "false")
+    set_env(
+        {
+            "STORAGE_BACKEND": "s3",
+            "S3_BUCKET": "test-bucket",
+            "S3_ENDPOINT": "http://minio:9000",
+            access_key_var: "key",
+            secret_key_var: "secret",
+            "S3_SECURE": "false",
+        }
+    )
 
     get_storage_settings.cache_clear()
     get_storage_client.cache_clear()
@@ -199,9 +222,8 @@ def test_factory_raises_on_invalid_backend(monkeypatch: pytest.MonkeyPatch) -> N
         get_storage_client.cache_clear()
 
 
-def test_factory_raises_on_missing_s3_bucket(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("STORAGE_BACKEND", "s3")
-    monkeypatch.setenv("S3_BUCKET", "")
+def test_factory_raises_on_missing_s3_bucket(set_env: SetEnv) -> None:
+    set_env({"STORAGE_BACKEND": "s3", "S3_BUCKET": ""})
 
     fake_boto3 = MagicMock()
     fake_botocore_config = MagicMock()
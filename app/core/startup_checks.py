@@ -21,6 +21,9 @@ logger = logging.getLogger("app_logger")
 
 EnsureDbSchemaFn = Callable[[], Awaitable[None]]
 
+# Built once; the readiness probe runs check_db on every /health hit.
+_DB_PROBE_STATEMENT = text("SELECT 1")
+
 
 async def check_s3(timeout_seconds: int = 5) -> tuple[bool, str]:
     try:
@@ -45,7 +48,7 @@ async def check_db(timeout_seconds: int = 5) -> tuple[bool, str]:
             return False, "engine not initialized"
         try:
             async with engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
+                await conn.execute(_DB_PROBE_STATEMENT)
             return True, "ok"
         except Exception as exc:  # pragma: no cover - runtime DB errors
             return False, str(exc)
@@ -1,5 +1,7 @@
 """Global FastAPI exception handlers for unified error responses."""
 
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from operator import itemgetter
 from typing import Any
 
 from fastapi import FastAPI, Request
@@ -32,20 +34,39 @@ async def unified_validation_error_handler(_request: Request, exc: Exception) ->
         body = build_error_response("SERVER_ERROR")
         return JSONResponse(status_code=500, content=body)
 
+    body = build_error_response("VALIDATION_FAILED", details=_validation_details(exc.errors()))
+    return JSONResponse(status_code=400, content=body)
+
+
+_LOC_TYPE_MSG = itemgetter("loc", "type", "msg")
+
+
+def _validation_details(errors: Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    """Map pydantic error dicts to unified ``details`` entries in a single pass."""
     details: list[dict[str, Any]] = []
-    for issue in exc.errors():
-        location = issue.get("loc", ())
-        field = ".".join(str(part) for part in location if part != "body")
-        details.append(
+    append = details.append
+    for issue in errors:
+        try:
+            loc, reason, expected = _LOC_TYPE_MSG(issue)
+        except KeyError:
+            # Hand-built errors may omit keys pydantic always sets.
+            loc = issue.get("loc", ())
+            reason = issue.get("type", "validation_error")
+            expected = issue.get("msg", "invalid value")
+        append(
             {
-                "field": field or "request",
-                "reason": str(issue.get("type", "validation_error")),
-                "expected": str(issue.get("msg", "invalid value")),
+                "field": ".".join([str(part) for part in loc if part != "body"]) or "request",
+                "reason": str(reason),
+                "expected": str(expected),
             }
         )
+    return details
 
-    body = build_error_response("VALIDATION_FAILED", details=details)
-    return JSONResponse(status_code=400, content=body)
+
+_HANDLERS: tuple[tuple[type[Exception], Callable[[Request, Exception], Awaitable[JSONResponse]]], ...] = (
+    (UnifiedApiError, unified_api_error_handler),
+    (RequestValidationError, unified_validation_error_handler),
+)
 
 
 def install_unified_exception_handlers(app: FastAPI) -> None:
@@ -57,8 +78,8 @@ def install_unified_exception_handlers(app: FastAPI) -> None:
     if getattr(app.state, marker, False):
         return
 
-    app.add_exception_handler(UnifiedApiError, unified_api_error_handler)
-    app.add_exception_handler(RequestValidationError, unified_validation_error_handler)
+    for exc_class, handler in _HANDLERS:
+        app.add_exception_handler(exc_class, handler)
     setattr(app.state, marker, True)
 
 
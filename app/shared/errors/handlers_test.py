@@ -2,6 +2,7 @@
 
 import json
 
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from pydantic import BaseModel
@@ -44,9 +45,14 @@ def _make_app() -> FastAPI:
     return app
 
 
+@pytest.fixture(scope="module")
+def client() -> TestClient:
+    """One app and client for the whole module; the handlers keep no per-request state."""
+    return TestClient(_make_app())
+
+
 class TestUnifiedApiErrorHandler:
-    def test_returns_unified_envelope(self) -> None:
-        client = TestClient(_make_app())
+    def test_returns_unified_envelope(self, client: TestClient) -> None:
         resp = client.get("/raise-unified")
         assert resp.status_code == 404
 
@@ -58,8 +64,7 @@ class TestUnifiedApiErrorHandler:
         assert "traceId" in error
         assert "timestamp" in error
 
-    def test_includes_details(self) -> None:
-        client = TestClient(_make_app())
+    def test_includes_details(self, client: TestClient) -> None:
         resp = client.get("/raise-unified-details")
         assert resp.status_code == 400
 
@@ -69,8 +74,7 @@ class TestUnifiedApiErrorHandler:
         assert len(error["details"]) == 1
         assert error["details"][0]["field"] == "name"
 
-    def test_custom_overrides(self) -> None:
-        client = TestClient(_make_app())
+    def test_custom_overrides(self, client: TestClient) -> None:
         resp = client.get("/raise-unified-custom")
         assert resp.status_code == 503
 
@@ -80,8 +84,7 @@ class TestUnifiedApiErrorHandler:
 
 
 class TestValidationErrorHandler:
-    def test_pydantic_validation_returns_unified(self) -> None:
-        client = TestClient(_make_app())
+    def test_pydantic_validation_returns_unified(self, client: TestClient) -> None:
         resp = client.post("/validate", content=json.dumps({}))
         assert resp.status_code == 400
 
@@ -93,6 +96,29 @@ class TestValidationErrorHandler:
         assert isinstance(error["details"], list)
         assert len(error["details"]) >= 1
 
+    def test_details_flatten_location_without_body_prefix(self) -> None:
+        from app.shared.errors.handlers import _validation_details
+
+        details = _validation_details(
+            [
+                {"loc": ("body", "items", 0, "qty"), "type": "int_parsing", "msg": "bad int"},
+                {"loc": ("body",), "type": "missing", "msg": "Field required"},
+            ]
+        )
+        assert details == [
+            {"field": "items.0.qty", "reason": "int_parsing", "expected": "bad int"},
+            {"field": "request", "reason": "missing", "expected": "Field required"},
+        ]
+
+    def test_details_fall_back_for_incomplete_errors(self) -> None:
+        from app.shared.errors.handlers import _validation_details
+
+        details = _validation_details([{"loc": ("query", "limit")}, {}])
+        assert details == [
+            {"field": "query.limit", "reason": "validation_error", "expected": "invalid value"},
+            {"field": "request", "reason": "validation_error", "expected": "invalid value"},
+        ]
+
 
 class TestIdempotentInstall:
     def test_double_install_is_noop(self) -> None:
@@ -1,11 +1,15 @@
 import logging
 from contextlib import asynccontextmanager
+from typing import Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware
+from starlette.routing import Route
 
 from app.config import get_app_settings, get_db_settings
 from app.core.core_api.healthcheck import healthcheck_router
+from app.core.core_auth.keys import prefetch_jwks
 from app.core.core_extensions.loader import (
     get_service_registrations,
     discover_service_module_names,
@@ -18,9 +22,8 @@ from app.core.core_middleware.http_security_middleware import (
     SecurityHeadersConfig,
     register_http_logging_middleware,
     register_rate_limit_middleware,
-    register_request_id_middleware,
+    register_request_lifecycle_middleware,
     register_request_size_middleware,
-    register_security_headers_middleware,
 )
 from app.core.startup_checks import perform_startup_checks
 from app.shared.errors.handlers import install_unified_exception_handlers
@@ -42,6 +45,43 @@ def join_path(prefix: str | None, suffix: str) -> str:
     return f"/{s}" if not p else f"/{p}/{s}"
 
 
+def register_cached_openapi_route(app: FastAPI) -> None:
+    """
+    Serve the OpenAPI schema from bytes encoded once instead of on every request.
+
+    Replaces FastAPI's default openapi route in place. The bytes are re-encoded
+    whenever app.openapi() returns a new schema object (e.g. after the schema
+    was reset), and per root_path so servers entries stay correct behind proxies.
+    """
+    openapi_url = app.openapi_url
+    if not openapi_url:
+        return
+
+    encoded: dict[str, tuple[dict[str, Any], bytes]] = {}
+
+    async def openapi(request: Request) -> Response:
+        root_path = request.scope.get("root_path", "").rstrip("/")
+        schema = app.openapi()
+        cached = encoded.get(root_path)
+        if cached is not None and cached[0] is schema:
+            return Response(cached[1], media_type="application/json")
+        document = schema
+        if root_path and app.root_path_in_servers:
+            server_urls = {server.get("url") for server in schema.get("servers", [])}
+            if root_path not in server_urls:
+                document = {**schema, "servers": [{"url": root_path}, *schema.get("servers", [])]}
+        body = bytes(JSONResponse(document).body)
+        encoded[root_path] = (schema, body)
+        return Response(body, media_type="application/json")
+
+    routes = app.router.routes
+    for index, route in enumerate(routes):
+        if isinstance(route, Route) and route.path == openapi_url:
+            routes[index] = Route(openapi_url, openapi, include_in_schema=False)
+            return
+    app.add_route(openapi_url, openapi, include_in_schema=False)
+
+
 def register_core_routers(app: FastAPI, api_prefix: str) -> None:
     app.include_router(healthcheck_router)
     app.include_router(healthcheck_router, prefix=api_prefix)
@@ -61,6 +101,9 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("Database disabled - skipping DB init")
 
+    # Warm the JWKS cache off the event loop (no-op unless AUTH_MODE=jwks)
+    await prefetch_jwks()
+
     # Startup: services
     service_regs = getattr(app.state, "service_registrations", [])
     runtime_services = await run_service_startup(app, service_regs)
@@ -87,6 +130,7 @@ def create_app() -> FastAPI:
         redoc_url=join_path(app_settings.API_PREFIX, "redoc"),
         openapi_url=join_path(app_settings.API_PREFIX, "openapi.json"),
     )
+    register_cached_openapi_route(app)
 
     # CORS
     origins = app_settings.cors_allowed_origins
@@ -101,7 +145,6 @@ def create_app() -> FastAPI:
 
     # Middleware (registered in reverse call order — last registered runs first)
     register_message_language_middleware(app)
-    register_request_id_middleware(app)
     register_http_logging_middleware(
         app,
         enabled=app_settings.HTTP_LOGGING_ENABLED,
@@ -114,7 +157,8 @@ def create_app() -> FastAPI:
         max_request_size_bytes=app_settings.MAX_REQUEST_SIZE_BYTES,
         max_upload_size_bytes=app_settings.MAX_UPLOAD_SIZE_BYTES,
     )
-    register_security_headers_middleware(
+    # Request id + security headers share one pure ASGI layer
+    register_request_lifecycle_middleware(
         app,
         SecurityHeadersConfig(
             enabled=app_settings.SECURITY_HEADERS_ENABLED,
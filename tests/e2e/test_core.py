@@ -34,3 +34,15 @@ def test_health_ready_alias_returns_ok():
     payload = response.json()
     assert payload["status"] == "ok"
     assert payload["checks"]["database"]["status"] == "skipped"
+
+
+def test_openapi_endpoint_serves_cached_schema() -> None:
+    with TestClient(app) as client:
+        first = client.get("/api/openapi.json")
+        second = client.get("/api/openapi.json")
+
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    assert first.content == second.content
+    assert first.json() == app.openapi()
+    assert sum(getattr(route, "path", None) == "/api/openapi.json" for route in app.router.routes) == 1